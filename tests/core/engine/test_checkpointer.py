@@ -0,0 +1,68 @@
+"""Tests for BoundedInMemorySaver."""
+
+from __future__ import annotations
+
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+import pytest
+
+from vibe.core.engine.checkpointer import BoundedInMemorySaver
+
+
+class _CounterState(TypedDict):
+    items: Annotated[list[int], operator.add]
+
+
+def _build_graph(checkpointer: BoundedInMemorySaver):
+    graph = StateGraph(_CounterState)
+    graph.add_node("step", lambda state: {"items": [len(state["items"])]})
+    graph.add_edge(START, "step")
+    graph.add_edge("step", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+class TestBoundedInMemorySaver:
+    def test_keeps_only_newest_checkpoints(self):
+        """Test that old checkpoints and their blobs are evicted per thread."""
+        saver = BoundedInMemorySaver(max_checkpoints=3)
+        graph = _build_graph(saver)
+        config = {"configurable": {"thread_id": "t1"}}
+
+        for _ in range(10):
+            graph.invoke({"items": []}, config)
+
+        checkpoints = saver.storage["t1"][""]
+        assert len(checkpoints) == 3
+        assert {key[2] for key in saver.writes if key[0] == "t1"} <= set(checkpoints)
+        # Only blobs referenced by the retained checkpoints survive
+        referenced = {
+            ("t1", "", channel, version)
+            for saved in saver.list(config)
+            for channel, version in saved.checkpoint["channel_versions"].items()
+        }
+        assert set(saver.blobs) == referenced
+        assert graph.get_state(config).values["items"] == list(range(10))
+
+    def test_threads_are_bounded_independently(self):
+        """Test that eviction in one thread leaves other threads untouched."""
+        saver = BoundedInMemorySaver(max_checkpoints=2)
+        graph = _build_graph(saver)
+
+        graph.invoke({"items": []}, {"configurable": {"thread_id": "a"}})
+        for _ in range(5):
+            graph.invoke({"items": []}, {"configurable": {"thread_id": "b"}})
+
+        assert len(saver.storage["a"][""]) == 2
+        assert len(saver.storage["b"][""]) == 2
+
+        saver.delete_thread("b")
+        assert "b" not in saver.storage
+        assert all(key[0] == "a" for key in saver.blobs)
+        assert len(list(saver.list({"configurable": {"thread_id": "a"}}))) == 2
+
+    def test_rejects_non_positive_limit(self):
+        """Test that at least one checkpoint must be kept."""
+        with pytest.raises(ValueError, match="at least 1"):
+            BoundedInMemorySaver(max_checkpoints=0)
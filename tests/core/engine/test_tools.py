@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from vibe.core.config import VibeConfig
 from vibe.core.engine.tools import VibeToolAdapter
 
@@ -21,3 +23,12 @@ class TestVibeToolAdapter:
         tool = VibeToolAdapter._create_bash_tool(config)
         assert tool.name == "bash"
         assert "bash command" in tool.description.lower()
+
+    @pytest.mark.asyncio
+    async def test_bash_tool_times_out(self, tmp_path):
+        """Test that the bash tool reports commands exceeding the timeout."""
+        config = VibeConfig(workdir=tmp_path)
+        tool = VibeToolAdapter._create_bash_tool(config)
+        assert tool.coroutine is not None
+        result = await tool.coroutine(command="sleep 5", timeout=1)
+        assert result == "Command timed out after 1 seconds"
@@ -6,12 +6,16 @@ works correctly with streaming, tools, approvals, and state management.
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
+from langchain_core.messages import AIMessageChunk
 import pytest
 
 from vibe.core.config import VibeConfig
 from vibe.core.engine.langchain_engine import VibeLangChainEngine
+from vibe.core.tools.base import BaseToolConfig, ToolPermission
+from vibe.core.types import AssistantEvent, ToolCallEvent
 
 
 class TestLangChainIntegration:
@@ -76,6 +80,269 @@ class TestLangChainIntegration:
         assert "ContextWarningMiddleware" in middleware_types
         assert "PriceLimitMiddleware" in middleware_types
         assert "HumanInTheLoopMiddleware" in middleware_types
+        assert "LoggerMiddleware" in middleware_types
+
+    def test_disabled_logging_omits_logger_middleware(self, config: VibeConfig):
+        """Test that disabled agent logging keeps LoggerMiddleware off the graph."""
+        config.agent_logging_enabled = False
+
+        engine = VibeLangChainEngine(config)
+        middleware_types = [type(m).__name__ for m in engine._build_middleware_stack()]
+
+        assert "LoggerMiddleware" not in middleware_types
+
+    @pytest.mark.asyncio
+    async def test_run_coalesces_streamed_chunks(self, config: VibeConfig):
+        """Test that queued tokens are merged and flushed before other events."""
+        from unittest.mock import MagicMock
+
+        async def fake_stream(*args: Any, **kwargs: Any):
+            for token in ["a", "b", "", "c", "d", "e"]:
+                yield {
+                    "event": "on_chat_model_stream",
+                    "data": {"chunk": AIMessageChunk(content=token)},
+                }
+            yield {
+                "event": "on_tool_start",
+                "name": "unknown_tool",
+                "data": {"input": {}},
+                "run_id": "1",
+            }
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": AIMessageChunk(content="f")},
+            }
+
+        engine = VibeLangChainEngine(config)
+        engine._agent = MagicMock()
+        engine._agent.astream_events = fake_stream
+
+        # The fake stream never suspends, so every event is already queued by
+        # the time run() reads the first chunk
+        events = [event async for event in engine.run("hi")]
+
+        assert [type(event) for event in events] == [
+            AssistantEvent,
+            ToolCallEvent,
+            AssistantEvent,
+        ]
+        assert [getattr(event, "content", None) for event in events] == [
+            "abcde",
+            None,
+            "f",
+        ]
+        assert [m.content for m in engine._messages if m.role == "assistant"] == [
+            "abcde",
+            "f",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_emits_text_when_stream_pauses(self, config: VibeConfig):
+        """Test that streamed text is emitted without waiting for the next event."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        release = asyncio.Event()
+
+        async def paused_stream(*args: Any, **kwargs: Any):
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": AIMessageChunk(content="Hel")},
+            }
+            # Hold the next event back until the first chunk has been seen
+            await release.wait()
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": AIMessageChunk(content="lo")},
+            }
+
+        engine = VibeLangChainEngine(config)
+        engine._agent = MagicMock()
+        engine._agent.astream_events = paused_stream
+
+        run = engine.run("hi")
+        first = await asyncio.wait_for(anext(run), timeout=1)
+        assert isinstance(first, AssistantEvent)
+        assert first.content == "Hel"
+
+        release.set()
+        rest = [event async for event in run]
+        assert [getattr(event, "content", None) for event in rest] == ["lo"]
+
+    @pytest.mark.asyncio
+    async def test_run_requests_only_consumed_run_types(self, config: VibeConfig):
+        """Test that astream_events is filtered to chat model and tool runs."""
+        from unittest.mock import MagicMock
+
+        captured: dict[str, Any] = {}
+
+        async def fake_stream(*args: Any, **kwargs: Any):
+            captured.update(kwargs)
+            return
+            yield
+
+        engine = VibeLangChainEngine(config)
+        engine._agent = MagicMock()
+        engine._agent.astream_events = fake_stream
+
+        _ = [event async for event in engine.run("hi")]
+
+        assert captured["include_types"] == ["chat_model", "tool"]
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_stream_errors(self, config: VibeConfig):
+        """Test that errors raised by the graph surface from run()."""
+        from unittest.mock import MagicMock
+
+        async def failing_stream(*args: Any, **kwargs: Any):
+            yield {
+                "event": "on_tool_start",
+                "name": "unknown_tool",
+                "data": {"input": {}},
+                "run_id": "1",
+            }
+            raise RuntimeError("model unavailable")
+
+        engine = VibeLangChainEngine(config)
+        engine._agent = MagicMock()
+        engine._agent.astream_events = failing_stream
+
+        events = []
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            async for event in engine.run("hi"):
+                events.append(event)
+
+        assert [type(event) for event in events] == [ToolCallEvent]
+
+    @pytest.mark.asyncio
+    async def test_closing_run_stops_the_graph_stream(self, config: VibeConfig):
+        """Test that abandoning run() cancels the background stream."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        stream_closed = asyncio.Event()
+
+        async def endless_stream(*args: Any, **kwargs: Any):
+            try:
+                while True:
+                    yield {
+                        "event": "on_chat_model_stream",
+                        "data": {"chunk": AIMessageChunk(content="x")},
+                    }
+                    await asyncio.sleep(0)
+            finally:
+                stream_closed.set()
+
+        engine = VibeLangChainEngine(config)
+        engine._agent = MagicMock()
+        engine._agent.astream_events = endless_stream
+
+        run = engine.run("hi")
+        assert isinstance(await anext(run), AssistantEvent)
+        await run.aclose()
+
+        await asyncio.wait_for(stream_closed.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_run_builds_agent_off_the_event_loop(self, config: VibeConfig):
+        """Test that run() rebuilds a reset agent in a worker thread."""
+        import threading
+        from unittest.mock import MagicMock
+
+        async def empty_stream(*args: Any, **kwargs: Any):
+            return
+            yield
+
+        engine = VibeLangChainEngine(config)
+        build_threads: list[threading.Thread] = []
+
+        def fake_initialize() -> None:
+            build_threads.append(threading.current_thread())
+            engine._agent = MagicMock()
+            engine._agent.astream_events = empty_stream
+
+        engine.initialize = fake_initialize
+
+        _ = [event async for event in engine.run("hi")]
+        _ = [event async for event in engine.run("again")]
+
+        assert len(build_threads) == 1
+        assert build_threads[0] is not threading.main_thread()
+
+    def test_system_prompt_and_tool_manager_reused_across_reset(
+        self, config: VibeConfig
+    ):
+        """Test that reset() keeps the prompt and shares one ToolManager."""
+        engine = VibeLangChainEngine(config)
+        engine.initialize()
+        system_prompt = engine._system_prompt
+        assert system_prompt is not None
+
+        engine.reset()
+        engine.initialize()
+
+        assert engine._system_prompt is system_prompt
+        assert engine._get_tui_event_mapper().tool_manager is engine.tool_manager
+
+    def test_pricing_config_reused(self, config: VibeConfig):
+        """Test that the per-token pricing table is only built once."""
+        engine = VibeLangChainEngine(config)
+        pricing = engine._get_pricing_config()
+        model = config.models[0]
+
+        assert pricing[model.name] == (
+            model.input_price / 1_000_000,
+            model.output_price / 1_000_000,
+        )
+        assert engine._get_pricing_config() is pricing
+
+    def test_interrupt_config_cached_across_reset(self, config: VibeConfig):
+        """Test that the interrupt config is reused until explicitly invalidated."""
+        engine = VibeLangChainEngine(config)
+        interrupt_on = engine._get_interrupt_config()
+        assert interrupt_on["bash"] is True
+
+        engine.reset()
+        assert engine._get_interrupt_config() is interrupt_on
+
+        config.tools["bash"] = BaseToolConfig(permission=ToolPermission.ALWAYS)
+        engine.invalidate_interrupt_cache()
+        assert "bash" not in engine._get_interrupt_config()
+
+    @pytest.mark.asyncio
+    async def test_invalidated_interrupt_config_rebuilds_agent(
+        self, config: VibeConfig
+    ):
+        """Test that a permission change rebuilds the agent on the same thread."""
+        from langchain_core.messages import HumanMessage
+
+        engine = VibeLangChainEngine(config)
+        engine.initialize()
+        agent = engine._agent
+        assert agent is not None
+        agent.update_state(engine._state_config, {"messages": [HumanMessage("hi")]})
+        session_id = engine.session_id
+
+        config.tools["bash"] = BaseToolConfig(permission=ToolPermission.ALWAYS)
+        engine.invalidate_interrupt_cache()
+        # A pending approval still resumes on the current graph
+        assert engine._agent is agent
+
+        await engine._ensure_agent()
+
+        assert engine._agent is not agent
+        assert engine.session_id == session_id
+        assert [m.content for m in engine.get_current_messages()] == ["hi"]
+        await engine._ensure_agent()
+        assert engine._agent is not agent
+
+    def test_fake_engine_accepts_permission_changes(self, config: VibeConfig):
+        """Test that the fake engine supports the TUI's permission-change hook."""
+        from tests.stubs.fake_backend import FakeVibeLangChainEngine
+        from vibe.cli.textual_ui.engine_interface import EngineInterface
+
+        assert hasattr(EngineInterface, "invalidate_interrupt_cache")
+        FakeVibeLangChainEngine(config).invalidate_interrupt_cache()
 
     @pytest.mark.asyncio
     async def test_error_handling_graceful(self, config: VibeConfig):
@@ -214,6 +481,17 @@ class TestMultiToolApprovalWorkflow:
             d["message"] == "Batch rejection" for d in command.resume["decisions"]
         )
 
+    @pytest.mark.asyncio
+    async def test_batch_decisions_share_one_decision(
+        self, engine: VibeLangChainEngine
+    ):
+        """Test that batch approve/reject repeat a single decision object."""
+        await engine.handle_reject_all(3, "No")
+
+        decisions = self._get_invoked_command(engine).resume["decisions"]
+        assert decisions == [{"type": "reject", "message": "No"}] * 3
+        assert decisions[0] is decisions[2]
+
     @pytest.mark.asyncio
     async def test_reject_all_with_none_feedback(self, engine: VibeLangChainEngine):
         """Test rejecting all tools with None feedback uses default message."""
@@ -322,6 +600,196 @@ class TestLangChainStateManagement:
         assert session_id2 != session_id1
         assert session_id2.startswith("vibe-session-")
 
+    def test_run_configs_follow_thread(self, config: VibeConfig):
+        """Test that the shared run configs are rebuilt for each new thread."""
+        engine = VibeLangChainEngine(config)
+        state_config = engine._state_config
+
+        assert state_config == {"configurable": {"thread_id": engine.session_id}}
+        assert engine._run_config["recursion_limit"] == config.max_recursion_depth
+
+        engine.reset()
+
+        assert engine._state_config is not state_config
+        assert engine._run_config["configurable"]["thread_id"] == engine.session_id
+
+    @pytest.mark.asyncio
+    async def test_message_count_tracked_from_events(self, config: VibeConfig):
+        """Test that stats count messages from events and sync once per turn."""
+        from unittest.mock import MagicMock
+
+        from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+        counts: list[int] = []
+
+        async def fake_stream(*args: Any, **kwargs: Any):
+            yield {"event": "on_chat_model_end", "data": {"output": AIMessage("")}}
+            counts.append(engine.stats._messages)
+            yield {"event": "on_tool_end", "name": "unknown_tool", "data": {}}
+            counts.append(engine.stats._messages)
+
+        engine = VibeLangChainEngine(config)
+        engine._agent = MagicMock()
+        engine._agent.astream_events = fake_stream
+        engine._agent.get_state.return_value.values = {
+            "messages": [
+                HumanMessage("hi", id="h1"),
+                AIMessage("", id="a1"),
+                ToolMessage("ok", tool_call_id="c1", id="t1"),
+            ]
+        }
+
+        _ = [event async for event in engine.run("hi")]
+        for _ in range(3):
+            _ = engine.stats
+
+        assert counts == [2, 3]
+        assert engine.stats._messages == 3
+        assert engine.stats.steps == 1
+        engine._agent.get_state.assert_called_once()
+
+        engine.reset()
+        assert engine.stats._messages == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_match_stored_state(self, config: VibeConfig, tmp_path: Path):
+        """Test that stats match the compiled graph's state across a real session."""
+        from langchain_core.language_models.fake_chat_models import (
+            FakeMessagesListChatModel,
+        )
+        from langchain_core.messages import AIMessage, ToolMessage
+
+        class ToolCallingFakeModel(FakeMessagesListChatModel):
+            def bind_tools(self, tools: Any, **kwargs: Any) -> Any:
+                return self
+
+        def reply(tokens: int, tool: str | None = None, args: Any = None):
+            tool_calls = (
+                []
+                if tool is None
+                else [{"name": tool, "args": args, "id": f"call-{tool}"}]
+            )
+            return AIMessage(
+                content="" if tool_calls else "done",
+                tool_calls=tool_calls,
+                usage_metadata={
+                    "input_tokens": tokens,
+                    "output_tokens": 5,
+                    "total_tokens": tokens + 5,
+                },
+            )
+
+        notes = tmp_path / "notes.txt"
+        notes.write_text("hello")
+        engine = VibeLangChainEngine(config)
+        engine._create_model = lambda: ToolCallingFakeModel(
+            responses=[
+                reply(10, "read_file", {"path": str(notes)}),
+                reply(20),
+                reply(30, "bash", {"command": "rm -rf build"}),
+                reply(40),
+            ]
+        )
+
+        def assert_stats_match_state(expected_steps: int) -> list[ToolMessage]:
+            messages = engine.get_current_messages()
+            succeeded = [
+                m
+                for m in messages
+                if isinstance(m, ToolMessage) and m.status == "success"
+            ]
+            assert engine.stats._messages == len(messages)
+            assert engine.stats.context_tokens == sum(
+                m.usage_metadata["total_tokens"]
+                for m in messages
+                if isinstance(m, AIMessage) and m.usage_metadata
+            )
+            assert engine.stats.steps == expected_steps
+            return succeeded
+
+        # An auto-approved tool runs inside the streamed turn
+        _ = [event async for event in engine.run("read the notes")]
+        assert len(assert_stats_match_state(1)) == 1
+
+        # A rejected tool never ends and the model answers during the resume
+        _ = [event async for event in engine.run("clean up")]
+        await engine.handle_reject_all(1, "no")
+        assert_stats_match_state(1)
+        assert engine.stats.context_tokens == 120
+
+        engine.compact()
+        assert_stats_match_state(1)
+
+    @pytest.mark.asyncio
+    async def test_turn_duration_and_generation_speed(self, config: VibeConfig):
+        """Test that run() times the turn and each model call."""
+        from itertools import count
+        from unittest.mock import MagicMock, patch
+
+        from langchain_core.messages import AIMessage
+
+        async def fake_stream(*args: Any, **kwargs: Any):
+            yield {"event": "on_chat_model_start", "data": {}}
+            yield {
+                "event": "on_chat_model_end",
+                "data": {
+                    "output": AIMessage(
+                        "",
+                        usage_metadata={
+                            "input_tokens": 5,
+                            "output_tokens": 40,
+                            "total_tokens": 45,
+                        },
+                    )
+                },
+            }
+
+        engine = VibeLangChainEngine(config)
+        engine._agent = MagicMock()
+        engine._agent.astream_events = fake_stream
+        clock = MagicMock()
+        clock.monotonic.side_effect = (2.0 * tick for tick in count())
+
+        with patch("vibe.core.engine.langchain_engine.time", clock):
+            _ = [event async for event in engine.run("hi")]
+
+        # turn start 0s, model start 2s, model end 4s, turn end 6s
+        assert engine.stats.tokens_per_second == 20.0
+        assert engine.stats.last_turn_duration == 6.0
+
+    def test_compact_caches_token_counts_by_message_id(self, config: VibeConfig):
+        """Test that compact() counts tokens once per message id."""
+        from langchain_core.messages import AIMessage, HumanMessage
+
+        engine = VibeLangChainEngine(config)
+        engine.initialize()
+        assert engine._agent is not None
+        messages = [HumanMessage(content="hi", id="h1")] + [
+            AIMessage(
+                content=f"reply {i}",
+                id=f"a{i}",
+                usage_metadata={
+                    "input_tokens": 10,
+                    "output_tokens": 5,
+                    "total_tokens": 15,
+                },
+            )
+            for i in range(3)
+        ]
+        engine._agent.update_state(
+            {"configurable": {"thread_id": engine._thread_id}},
+            {"messages": messages},
+        )
+
+        result = engine.compact()
+
+        assert result.endswith("reducing tokens from 45 to 30")
+        assert engine._token_cache == {"a1": 15, "a2": 15}
+        assert engine.stats.context_tokens == 30
+
+        engine.reset()
+        assert engine._token_cache == {}
+
 
 class TestLangChainEngineExports:
     """Test that engine exports are correctly configured."""
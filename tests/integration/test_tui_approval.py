@@ -299,6 +299,23 @@ class TestVibeAppMultiToolApproval:
                 calls = mock_handle.call_args[0][0]
                 assert len(calls) == 2
 
+    @pytest.mark.asyncio
+    async def test_handle_engine_interrupt_rejects_malformed_data(
+        self, mock_app: VibeApp
+    ):
+        """Test that interrupts without a dict payload are rejected, not raised."""
+        with patch.object(
+            mock_app, "_handle_multi_tool_approval", new_callable=AsyncMock
+        ) as mock_handle:
+            for interrupt_data in ({}, {"data": None}, {"data": {"other": 1}}):
+                result = await mock_app._handle_engine_interrupt(interrupt_data)
+                assert result == {
+                    "approved": False,
+                    "error": "Invalid interrupt format",
+                }
+
+            mock_handle.assert_not_called()
+
     @pytest.mark.skip(
         reason="Legacy format handling removed - test no longer applicable"
     )
@@ -7,13 +7,13 @@ approval dialogs.
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from vibe.core.config import VibeConfig
 from vibe.core.engine.langchain_engine import VibeEngineStats, VibeLangChainEngine
-from vibe.core.engine.tui_events import TUIEventMapper
+from vibe.core.engine.tui_events import GenericArgs, GenericResult, TUIEventMapper
 from vibe.core.types import AssistantEvent, ToolCallEvent, ToolResultEvent
 
 
@@ -66,6 +66,19 @@ class TestTUIEventMapper:
         result = mapper.map_event(native_event)
         assert result is None
 
+    def test_chunk_text_returns_plain_text_only(self, mapper: TUIEventMapper):
+        """Test that chunk_text extracts text without building events."""
+
+        def event(content: object) -> dict:
+            chunk = Mock()
+            chunk.content = content
+            return {"event": "on_chat_model_stream", "data": {"chunk": chunk}}
+
+        assert mapper.chunk_text(event("Hi")) == "Hi"
+        assert mapper.chunk_text(event("")) is None
+        assert mapper.chunk_text(event([{"type": "text", "text": "Hi"}])) is None
+        assert mapper.chunk_text({"event": "on_chat_model_stream"}) is None
+
     def test_mapper_handles_tool_start(self, mapper: TUIEventMapper):
         """Test that TUIEventMapper correctly maps on_tool_start events."""
         native_event = {
@@ -151,6 +164,58 @@ class TestTUIEventMapper:
         args_field = getattr(result.args, "args", None)
         assert args_field == {"param1": "value1", "param2": "value2"}
 
+    def test_mapper_fallback_args_without_input(self, mapper: TUIEventMapper):
+        """Test that a missing tool input yields a fresh, empty GenericArgs."""
+        native_event = {"event": "on_tool_start", "name": "unknown_tool_xyz"}
+
+        first = mapper.map_event(native_event)
+        second = mapper.map_event(native_event)
+
+        assert isinstance(first, ToolCallEvent)
+        assert isinstance(second, ToolCallEvent)
+        assert isinstance(first.args, GenericArgs)
+        assert isinstance(second.args, GenericArgs)
+        assert first.args.args == {}
+        assert first.args.args is not second.args.args
+
+    def test_mapper_caches_tool_class_lookups(self, mapper: TUIEventMapper):
+        """Test that tool classes are resolved once per tool name."""
+        assert mapper._tool_manager is None  # Created lazily
+
+        native_event = {
+            "event": "on_tool_start",
+            "name": "unknown_tool_xyz",
+            "data": {"input": {}},
+            "run_id": "test-run-id",
+        }
+        mapper.map_event(native_event)
+        tool_manager = mapper._tool_manager
+        assert tool_manager is not None
+
+        with patch.object(tool_manager, "get") as mock_get:
+            mapper.map_event(native_event)
+            mock_get.assert_not_called()
+
+        assert mapper._tool_info_cache == {"unknown_tool_xyz": None}
+
+    def test_mapper_caches_tool_models_with_class(self, mapper: TUIEventMapper):
+        """Test that a known tool's class and args/result models are cached together."""
+
+        class _StubTool:
+            calls = 0
+
+            @classmethod
+            def _get_tool_args_results(cls) -> tuple[type, type]:
+                cls.calls += 1
+                return GenericArgs, GenericResult
+
+        with patch.object(mapper.tool_manager, "get", return_value=_StubTool()):
+            tool_info = mapper._get_tool_info("stub")
+            assert mapper._get_tool_info("stub") is tool_info
+
+        assert tool_info == (_StubTool, GenericArgs, GenericResult)
+        assert _StubTool.calls == 1
+
 
 class TestVibeLangChainEngineWithMapper:
     """Test VibeLangChainEngine integration with TUIEventMapper."""
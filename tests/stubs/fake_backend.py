@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator, Callable, Iterable
+from types import SimpleNamespace
 
 from langchain.agents.middleware.human_in_the_loop import HITLRequest, HITLResponse
 from langgraph.types import Command
@@ -205,6 +206,14 @@ class FakeInterruptedAgent:
             hitl_response = HITLResponse(**command.resume)
             self._decisions_received.append(hitl_response)
 
+    def get_state(self, config: dict | None = None) -> SimpleNamespace:
+        """Mock get_state method returning an empty conversation.
+
+        Args:
+            config: Configuration dict (unused in mock)
+        """
+        return SimpleNamespace(values={"messages": []})
+
 
 class FakeVibeLangChainEngine:
     """Mock implementation of VibeLangChainEngine for testing.
@@ -356,6 +365,9 @@ class FakeVibeLangChainEngine:
             f"reducing from {old_count} to {keep_count}"
         )
 
+    def invalidate_interrupt_cache(self) -> None:
+        """Accept tool permission changes (no interrupts to rebuild)."""
+
     def get_log_path(self) -> str | None:
         """Get the path to the current session's log file."""
         return None
@@ -88,6 +88,13 @@ class TestAgentStatsHelpers:
         assert stats.input_price_per_million == 1.5
         assert stats.output_price_per_million == 3.0
 
+    def test_unknown_field_assignment_rejected(self) -> None:
+        """Test that stats only accept their declared fields."""
+        stats = VibeEngineStats()
+
+        with pytest.raises(AttributeError):
+            stats.sesion_prompt_tokens = 1  # type: ignore[attr-defined]
+
     def test_reset_context_state_preserves_cumulative(self) -> None:
         """Test that reset_context_state preserves cumulative stats."""
         stats = VibeEngineStats()
@@ -557,3 +557,30 @@ line9
         assert "Path is not a directory" in error_msg
         assert "Use 'view' command to examine file contents" in error_msg
         assert "Specify a directory path to search" in error_msg
+
+    async def test_concurrent_searches_run_off_the_event_loop(
+        self, grep_tool: GrepTool, temp_dir: Path
+    ) -> None:
+        """Test that parallel grep calls scan files in worker threads."""
+        import asyncio
+        import threading
+
+        (temp_dir / "a.py").write_text("needle\n")
+        loop_thread = threading.get_ident()
+        search_threads: list[int] = []
+        search_files = grep_tool._search_files
+
+        def record_thread(*args, **kwargs):
+            search_threads.append(threading.get_ident())
+            return search_files(*args, **kwargs)
+
+        object.__setattr__(grep_tool, "_search_files", record_thread)
+
+        results = await asyncio.gather(
+            grep_tool._arun(path=str(temp_dir), query="needle"),
+            grep_tool._arun(path=str(temp_dir), query="needle"),
+        )
+
+        assert all("a.py" in result.output for result in results)
+        assert len(search_threads) == 2
+        assert loop_thread not in search_threads
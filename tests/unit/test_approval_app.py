@@ -0,0 +1,247 @@
+"""Unit tests for the approval dialog widget helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+from textual.app import App, ComposeResult
+
+from vibe.cli.textual_ui.widgets import approval_app
+from vibe.cli.textual_ui.widgets.approval_app import (
+    _RESULT_KEYS,
+    ApprovalApp,
+    _approval_payload,
+    _ApprovalPayloadCache,
+    _FrozenArgs,
+    _payload_cache,
+)
+from vibe.cli.textual_ui.widgets.tool_widgets import BashApprovalWidget
+from vibe.core.config import SessionLoggingConfig, VibeConfig
+
+
+class TestApprovalPayloadCache:
+    """Test memoization of renderer approval payloads."""
+
+    def test_equal_args_share_cached_payload(self):
+        """Test that identical args hit the same cache entry."""
+        first = _payload_cache.get("bash", _FrozenArgs({"command": "ls"}))
+        second = _payload_cache.get("bash", _FrozenArgs({"command": "ls"}))
+
+        assert first is second
+        assert first[0] is BashApprovalWidget
+        assert first[1]["command"] == "ls"
+
+    def test_payload_data_is_not_shared_between_widgets(self):
+        """Test that each caller gets its own copy of the cached data."""
+        args = {"command": "ls"}
+        first_class, first = _approval_payload("bash", args)
+        _, second = _approval_payload("bash", args)
+
+        assert first_class is BashApprovalWidget
+        assert first == second
+        assert first is not second
+        assert first is not args
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache keeps only its most recently used payloads."""
+        cache = _ApprovalPayloadCache(maxsize=2)
+        ls, pwd, cwd = (
+            _FrozenArgs({"command": command}) for command in ("ls", "pwd", "cwd")
+        )
+
+        cache.get("bash", ls)
+        cache.get("bash", pwd)
+        cache.get("bash", ls)
+        cache.get("bash", cwd)
+
+        assert ("bash", ls) in cache
+        assert ("bash", pwd) not in cache
+        assert len(cache) == 2
+
+    def test_fill_from_cleared_generation_is_dropped(self):
+        """Test that a fill started before clear() does not repopulate the cache."""
+        cache = _ApprovalPayloadCache(maxsize=2)
+        generation = cache.generation
+        cache.clear()
+
+        widget_class, data = cache.get(
+            "bash", _FrozenArgs({"command": "ls"}), generation
+        )
+
+        assert widget_class is BashApprovalWidget
+        assert data["command"] == "ls"
+        assert len(cache) == 0
+
+    def test_frozen_args_distinguish_value_types(self):
+        """Test that values with equal hashes but different types don't collide."""
+        assert _FrozenArgs({"flag": 1}) != _FrozenArgs({"flag": True})
+        assert _FrozenArgs({"items": [1, 2]}) == _FrozenArgs({"items": [1, 2]})
+
+    def test_unhashable_args_raise_type_error(self):
+        """Test that unhashable values are rejected so callers can fall back."""
+        with pytest.raises(TypeError):
+            _FrozenArgs({"data": bytearray(b"x")})
+
+
+class _ApprovalHostApp(App):
+    def __init__(self, action_requests: list[dict]) -> None:
+        super().__init__()
+        self._action_requests = action_requests
+        self._pending_approval: asyncio.Future[dict] | None = None
+
+    def compose(self) -> ComposeResult:
+        yield ApprovalApp(
+            action_requests=self._action_requests,
+            workdir=".",
+            config=VibeConfig(session_logging=SessionLoggingConfig(enabled=False)),
+        )
+
+
+class TestApprovalOptions:
+    """Test rendering of the approval options during navigation."""
+
+    @pytest.mark.asyncio
+    async def test_navigation_moves_cursor_between_options(self):
+        """Test that moving down flips only the old and new option styles."""
+        app = _ApprovalHostApp([{"name": "bash", "args": {"command": "ls"}}])
+
+        async with app.run_test() as pilot:
+            approval_app = app.query_one(ApprovalApp)
+            await pilot.press("down")
+
+            first, second, third = approval_app.option_widgets[:3]
+            assert approval_app.selected_option == 1
+            assert first.has_class("approval-option-selected")
+            assert not first.has_class("approval-cursor-selected")
+            assert second.has_class("approval-cursor-selected")
+            assert not second.has_class("approval-option-selected")
+            assert third.has_class("approval-option-no")
+            assert str(second.render()).startswith("› 2. Yes and always allow bash")
+
+    @pytest.mark.asyncio
+    async def test_selection_resolves_pending_approval_future(self):
+        """Test that selecting an option resolves the app's pending future."""
+        app = _ApprovalHostApp([{"name": "bash", "args": {"command": "ls"}}])
+
+        async with app.run_test() as pilot:
+            future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+            app._pending_approval = future
+
+            await pilot.press("y")
+
+            assert future.done()
+            assert future.result() == {
+                "approved": True,
+                "always_approve": False,
+                "feedback": None,
+                "batch_approve": False,
+                "batch_reject": False,
+                "next_tool": None,
+            }
+
+    @pytest.mark.asyncio
+    async def test_final_decision_clears_payload_cache(self):
+        """Test that cached tool args are dropped once the batch is decided."""
+        app = _ApprovalHostApp([
+            {"name": "bash", "args": {"command": "ls"}},
+            {"name": "bash", "args": {"command": "pwd"}},
+        ])
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+            app._pending_approval = future
+            assert len(_payload_cache) > 0
+
+            await pilot.press("4")
+
+            assert future.result()["batch_approve"] is True
+            assert len(_payload_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_decision_during_prewarm_keeps_payload_cache_empty(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a prewarm still rendering when the batch is decided stores nothing."""
+        rendering = threading.Event()
+        release = threading.Event()
+        render = approval_app._cached_renderer
+
+        class BlockingRenderer:
+            def __init__(self, tool_name: str) -> None:
+                self._renderer = render(tool_name)
+                self._tool_name = tool_name
+
+            def get_approval_widget(self, tool_args: dict[str, Any]) -> Any:
+                if self._tool_name == "grep":
+                    rendering.set()
+                    release.wait(timeout=5)
+                return self._renderer.get_approval_widget(tool_args)
+
+        monkeypatch.setattr(approval_app, "_cached_renderer", BlockingRenderer)
+        app = _ApprovalHostApp([
+            {"name": "bash", "args": {"command": "ls"}},
+            {"name": "grep", "args": {"pattern": "decided-mid-prewarm"}},
+        ])
+
+        async with app.run_test() as pilot:
+            assert await asyncio.to_thread(rendering.wait, 5)
+            future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+            app._pending_approval = future
+
+            await pilot.press("4")
+            release.set()
+            await app.workers.wait_for_complete()
+
+            assert future.result()["batch_approve"] is True
+            assert len(_payload_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_results_share_the_same_keys(self):
+        """Test that every option resolves with the full result key set."""
+        app = _ApprovalHostApp([
+            {"name": "bash", "args": {"command": "ls"}},
+            {"name": "bash", "args": {"command": "pwd"}},
+        ])
+
+        async with app.run_test() as pilot:
+            future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+            app._pending_approval = future
+
+            await pilot.press("n")
+
+            result = future.result()
+            assert tuple(result) == _RESULT_KEYS
+            assert result["approved"] is False
+            assert result["next_tool"] == 1
+
+    @pytest.mark.asyncio
+    async def test_single_tool_mounts_only_three_options(self):
+        """Test that batch options are only mounted for multi-tool approvals."""
+        single = _ApprovalHostApp([{"name": "bash", "args": {"command": "ls"}}])
+        async with single.run_test():
+            assert len(single.query(".approval-option")) == 3
+
+        batch = _ApprovalHostApp([
+            {"name": "bash", "args": {"command": "ls"}},
+            {"name": "bash", "args": {"command": "pwd"}},
+        ])
+        async with batch.run_test():
+            assert len(batch.query(".approval-option")) == 5
+
+    @pytest.mark.asyncio
+    async def test_mount_prewarms_payloads_for_remaining_tools(self):
+        """Test that the next tools' approval payloads are cached on mount."""
+        app = _ApprovalHostApp([
+            {"name": "bash", "args": {"command": "ls"}},
+            {"name": "grep", "args": {"pattern": "prewarm-me"}},
+        ])
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert ("grep", _FrozenArgs({"pattern": "prewarm-me"})) in _payload_cache
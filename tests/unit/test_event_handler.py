@@ -0,0 +1,82 @@
+"""Unit tests for the TUI EventHandler dispatch."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from textual.widgets import Static
+
+from vibe.cli.textual_ui.handlers.event_handler import EventHandler
+from vibe.cli.textual_ui.widgets.messages import AssistantMessage
+from vibe.core.types import AssistantEvent, InterruptEvent, ToolErrorEvent
+
+
+def _make_handler(**kwargs) -> tuple[EventHandler, AsyncMock]:
+    mount = AsyncMock()
+    handler = EventHandler(
+        mount_callback=mount,
+        scroll_callback=MagicMock(),
+        todo_area_callback=MagicMock(),
+        get_tools_collapsed=lambda: False,
+        get_todos_collapsed=lambda: False,
+        **kwargs,
+    )
+    return handler, mount
+
+
+class TestEventHandlerDispatch:
+    """Test routing of events to their handlers."""
+
+    @pytest.mark.asyncio
+    async def test_assistant_event_mounts_message(self):
+        """Test that assistant events mount an AssistantMessage."""
+        handler, mount = _make_handler()
+
+        result = await handler.handle_event(AssistantEvent(content="hi"))
+
+        assert result is None
+        mount.assert_awaited_once()
+        assert isinstance(mount.call_args.args[0], AssistantMessage)
+
+    @pytest.mark.asyncio
+    async def test_interrupt_event_calls_interrupt_callback(self):
+        """Test that interrupt events are forwarded to the interrupt callback."""
+        interrupt_callback = AsyncMock()
+        handler, mount = _make_handler(interrupt_callback=interrupt_callback)
+
+        await handler.handle_event(InterruptEvent(interrupt_data={"data": {}}))
+
+        interrupt_callback.assert_awaited_once_with({"data": {}})
+        mount.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_event_subclass_uses_base_class_handler(self):
+        """Test that event subclasses are routed like their base class."""
+
+        class StreamedAssistantEvent(AssistantEvent):
+            pass
+
+        handler, mount = _make_handler()
+
+        await handler.handle_event(StreamedAssistantEvent(content="hi"))
+
+        mount.assert_awaited_once()
+        assert isinstance(mount.call_args.args[0], AssistantMessage)
+        assert (
+            handler._handlers[StreamedAssistantEvent]
+            == handler._handle_assistant_message
+        )
+
+    @pytest.mark.asyncio
+    async def test_unhandled_event_falls_back_to_unknown(self):
+        """Test that events without a handler are shown as unknown events."""
+        handler, mount = _make_handler()
+
+        await handler.handle_event(
+            ToolErrorEvent(tool_name="bash", error="boom", tool_call_id="1")
+        )
+
+        widget = mount.call_args.args[0]
+        assert isinstance(widget, Static)
+        assert widget.has_class("unknown-event")
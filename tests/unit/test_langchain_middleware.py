@@ -77,6 +77,18 @@ class TestContextWarningMiddleware:
         result2 = middleware.before_model(state_with_meta, cast(Runtime, None))
         assert result2 is None
 
+    def test_warning_at_exact_threshold(self):
+        """Test that reaching the threshold exactly triggers the warning."""
+        middleware = ContextWarningMiddleware(threshold_percent=0.25, max_context=2000)
+        middleware._cumulative_tokens = 499
+
+        assert middleware.before_model({"messages": []}, cast(Runtime, None)) is None
+
+        middleware._cumulative_tokens = 500
+        result = middleware.before_model({"messages": []}, cast(Runtime, None))
+        assert result is not None
+        assert "25%" in result["warning"]
+
     def test_no_warning_when_max_context_none(self):
         """Test that no warning is injected when max_context is None."""
         middleware = ContextWarningMiddleware(threshold_percent=0.5, max_context=None)
@@ -126,6 +138,19 @@ class TestContextWarningMiddleware:
         assert "warning" in result
         assert "650%" in result["warning"]  # 6500/1000 = 650%
 
+    def test_estimate_tokens_mixed_content(self):
+        """Test that estimation counts text across plain and multi-part content."""
+        middleware = ContextWarningMiddleware(threshold_percent=0.5, max_context=1000)
+
+        messages = [
+            "a" * 8,
+            AIMessage(content=[{"type": "text", "text": "b" * 8}, "c" * 4]),
+            {"text": "d" * 4},
+            AIMessage(content=[{"type": "image_url", "image_url": "x"}]),
+        ]
+
+        assert middleware._estimate_tokens(messages) == 6  # 24 chars / 4
+
     def test_warning_message_format(self):
         """Test warning message is properly formatted."""
         middleware = ContextWarningMiddleware(threshold_percent=0.75, max_context=10000)
@@ -519,6 +544,24 @@ class TestLoggerMiddleware:
             result_log = mock_logger.info.call_args_list[1]
             assert "plain string result" in result_log[0][0]
 
+    def test_wrap_tool_call_skips_formatting_when_info_disabled(self):
+        """Test that tool arguments and results are not formatted below INFO."""
+        middleware = LoggerMiddleware(enabled=True)
+
+        request = MagicMock()
+        request.tool_call = {"name": "test_tool", "arguments": {"param": "value"}}
+
+        with (
+            patch("vibe.core.engine.langchain_middleware.logger") as mock_logger,
+            patch.object(middleware, "_truncate_result") as mock_truncate,
+        ):
+            mock_logger.isEnabledFor.return_value = False
+            result = middleware.wrap_tool_call(request, lambda req: "tool result")
+
+        assert result == "tool result"
+        mock_logger.info.assert_not_called()
+        mock_truncate.assert_not_called()
+
     def test_model_call_error_handling(self):
         """Test model call error handling."""
         middleware = LoggerMiddleware(enabled=True)
@@ -298,6 +298,10 @@ class VibeAcpAgent(AcpAgent):
         return PromptResponse(stopReason="end_turn")
 
     def _build_text_prompt(self, acp_prompt: list[ContentBlock]) -> str:
+        # Fast path: a single plain-text block is by far the most common prompt.
+        if len(acp_prompt) == 1 and (block := acp_prompt[0]).type == "text":
+            return block.text
+
         text_prompt = ""
         for block in acp_prompt:
             separator = "\n\n" if text_prompt else ""
@@ -368,9 +372,11 @@ class VibeAcpAgent(AcpAgent):
     @override
     async def cancel(self, params: CancelNotification) -> None:
         session = self._get_session(params.sessionId)
-        if session.task and not session.task.done():
-            session.task.cancel()
-            session.task = None
+        # Read the task once: resetting `session.task` here could race with a new
+        # prompt, and `prompt` already clears it in its `finally` block.
+        task = session.task
+        if task is not None and not task.done():
+            task.cancel()
 
     @override
     async def extMethod(self, method: str, params: dict) -> dict:
@@ -290,6 +290,8 @@ class VibeApp(App):
             self.config.tools[tool_name] = BaseToolConfig()
 
         self.config.tools[tool_name].permission = ToolPermission.ALWAYS
+        if self.agent:
+            self.agent.invalidate_interrupt_cache()
 
     def _save_config_changes(self, changes: dict[str, str]) -> None:
         if not changes:
@@ -426,8 +428,8 @@ class VibeApp(App):
             # HITL middleware handles approvals
             engine = VibeLangChainEngine(config=self.config)
 
-            # Initialize the engine
-            engine.initialize()
+            # Build the agent graph in a worker thread so the UI keeps rendering
+            await asyncio.to_thread(engine.initialize)
 
             self.agent = engine
 
@@ -472,15 +474,15 @@ class VibeApp(App):
     ) -> dict[str, Any]:
         """Handle interrupt from VibeEngine requiring approval."""
         # Extract action request from interrupt data
-        data = interrupt_data.get("data", {})
+        data = interrupt_data.get("data")
 
         # Validate interrupt data structure
-        if "action_requests" not in data:
+        if not isinstance(data, dict) or "action_requests" not in data:
             logger.warning(f"Interrupt data missing 'action_requests': {data}")
             return {"approved": False, "error": "Invalid interrupt format"}
 
         # HumanInTheLoopMiddleware always provides action_requests
-        action_requests = data.get("action_requests", [])
+        action_requests = data["action_requests"]
 
         # Validate action_requests is a list
         if not isinstance(action_requests, list):
@@ -894,7 +896,7 @@ class VibeApp(App):
             self._mode_indicator.display = False
 
         # Use the existing _pending_approval pattern
-        self._pending_approval = asyncio.Future()
+        self._pending_approval = asyncio.get_running_loop().create_future()
 
         approval_app = ApprovalApp(
             action_requests=action_requests,
@@ -41,6 +41,10 @@ class EngineInterface(Protocol):
         """Compact the conversation history and return a summary."""
         ...
 
+    def invalidate_interrupt_cache(self) -> None:
+        """Apply changed tool permissions from the next turn on."""
+        ...
+
     def get_log_path(self) -> str | None:
         """Get the path to the interaction log file, if any."""
         ...
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
 from textual.widgets import Static
 
@@ -42,6 +42,16 @@ class EventHandler:
         self.current_tool_call: ToolCallMessage | None = None
         self.current_compact: CompactMessage | None = None
         self.tool_results: list[ToolResultMessage] = []
+        # Event type -> handler; ToolCallEvent is handled separately since it
+        # needs the loading widget and returns the mounted message. Subclasses
+        # are resolved along their MRO once, then cached here by exact type.
+        self._handlers: dict[type[BaseEvent], Callable[[Any], Awaitable[None]]] = {
+            ToolResultEvent: self._handle_tool_result,
+            AssistantEvent: self._handle_assistant_message,
+            InterruptEvent: self._handle_interrupt,
+            CompactStartEvent: self._handle_compact_start,
+            CompactEndEvent: self._handle_compact_end,
+        }
 
     async def handle_event(
         self,
@@ -50,25 +60,28 @@ class EventHandler:
         loading_widget: LoadingWidget | None = None,
     ) -> ToolCallMessage | None:
         """Handle events and return tool call message if applicable."""
-        result: ToolCallMessage | None = None
-        match event:
-            case ToolCallEvent():
-                result = await self._handle_tool_call(event, loading_widget)
-            case ToolResultEvent():
-                sanitized_event = self._sanitize_event(event)
-                await self._handle_tool_result(sanitized_event)
-            case AssistantEvent():
-                await self._handle_assistant_message(event)
-            case InterruptEvent():
-                await self._handle_interrupt(event)
-            case CompactStartEvent():
-                await self._handle_compact_start()
-            case CompactEndEvent():
-                await self._handle_compact_end(event)
-            case _:
-                await self._handle_unknown_event(event)
-
-        return result
+        if isinstance(event, ToolCallEvent):
+            return await self._handle_tool_call(event, loading_widget)
+
+        event_type = type(event)
+        handler = self._handlers.get(event_type) or self._resolve_handler(event_type)
+        await handler(event)
+        return None
+
+    def _resolve_handler(
+        self, event_type: type[BaseEvent]
+    ) -> Callable[[Any], Awaitable[None]]:
+        """Find the handler of the closest handled base class and cache it."""
+        handler = next(
+            (
+                self._handlers[base]
+                for base in event_type.__mro__
+                if base in self._handlers
+            ),
+            self._handle_unknown_event,
+        )
+        self._handlers[event_type] = handler
+        return handler
 
     async def _handle_interrupt(self, event: InterruptEvent) -> None:
         if self.interrupt_callback:
@@ -112,6 +125,7 @@ class EventHandler:
         return tool_call
 
     async def _handle_tool_result(self, event: ToolResultEvent) -> None:
+        event = self._sanitize_event(event)
         if event.tool_name == "todo":
             todos_collapsed = self.get_todos_collapsed()
             tool_result = ToolResultMessage(
@@ -134,7 +148,7 @@ class EventHandler:
     async def _handle_assistant_message(self, event: AssistantEvent) -> None:
         await self.mount_callback(AssistantMessage(event.content))
 
-    async def _handle_compact_start(self) -> None:
+    async def _handle_compact_start(self, event: CompactStartEvent) -> None:
         compact_msg = CompactMessage()
         self.current_compact = compact_msg
         await self.mount_callback(compact_msg)
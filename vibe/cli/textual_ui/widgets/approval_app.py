@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from threading import Lock
 from typing import Any, ClassVar
 
 from textual import events
@@ -10,49 +16,241 @@ from textual.message import Message
 from textual.widgets import Static
 
 from vibe.cli.textual_ui.renderers import get_renderer
+from vibe.cli.textual_ui.renderers.tool_renderers import ToolRenderer
+from vibe.cli.textual_ui.widgets.tool_widgets import ToolApprovalWidget
 from vibe.core.config import VibeConfig
 
 
+@dataclass(frozen=True, slots=True)
+class _ActionRequestView:
+    """Typed view over a HITL action request dict."""
+
+    action_request: dict[str, Any]
+    tool_name: str
+    tool_args: dict[str, Any]
+
+    @classmethod
+    def of(cls, action_request: dict[str, Any]) -> _ActionRequestView:
+        return cls(
+            action_request,
+            action_request.get("name", ""),
+            action_request.get("args") or {},
+        )
+
+
+def _freeze(obj: Any) -> Hashable:
+    """Convert tool args into a hashable key.
+
+    Raises:
+        TypeError: If a value cannot be hashed.
+    """
+    if isinstance(obj, dict):
+        return (
+            dict,
+            tuple(sorted((key, _freeze(value)) for key, value in obj.items())),
+        )
+    if isinstance(obj, list | tuple):
+        return (type(obj), tuple(_freeze(item) for item in obj))
+    hash(obj)
+    return (type(obj), obj)
+
+
+class _FrozenArgs:
+    """Hashable wrapper keeping the original args next to their frozen key."""
+
+    __slots__ = ("_key", "args")
+
+    def __init__(self, args: dict[str, Any]) -> None:
+        self.args = args
+        self._key = _freeze(args)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _FrozenArgs) and self._key == other._key
+
+
+# Every approval result carries exactly these keys, whichever option was chosen.
+_RESULT_KEYS = (
+    "approved",
+    "always_approve",
+    "feedback",
+    "batch_approve",
+    "batch_reject",
+    "next_tool",
+)
+
+
+def _make_result(
+    approved: bool,
+    feedback: str | None = None,
+    *,
+    always_approve: bool = False,
+    batch_approve: bool = False,
+    batch_reject: bool = False,
+    next_tool: int | None = None,
+) -> dict[str, Any]:
+    """Build an approval result dict with the full `_RESULT_KEYS` shape."""
+    return {
+        "approved": approved,
+        "always_approve": always_approve,
+        "feedback": feedback,
+        "batch_approve": batch_approve,
+        "batch_reject": batch_reject,
+        "next_tool": next_tool,
+    }
+
+
+@lru_cache(maxsize=64)
+def _cached_renderer(tool_name: str) -> ToolRenderer:
+    return get_renderer(tool_name)
+
+
+# Approval payloads only need to outlive one batch of approvals: the dialog is
+# rebuilt for each tool, and the cache is cleared once the batch is decided.
+_PAYLOAD_CACHE_SIZE = 8
+
+_ApprovalPayload = tuple[type[ToolApprovalWidget], dict[str, Any]]
+
+
+class _ApprovalPayloadCache:
+    """LRU cache of approval payloads, filled from the UI and prewarm threads.
+
+    clear() starts a new generation. A fill started under an older generation
+    is not stored, so a prewarm still rendering when the batch is decided
+    cannot bring the cleared tool args back.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, _FrozenArgs], _ApprovalPayload] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+        self.generation = 0
+
+    def get(
+        self, tool_name: str, frozen_args: _FrozenArgs, generation: int | None = None
+    ) -> _ApprovalPayload:
+        """Return the cached payload, rendering and storing it on a miss.
+
+        Args:
+            tool_name: Name of the tool awaiting approval.
+            frozen_args: The tool args, frozen into a cache key.
+            generation: Generation the caller started under; defaults to the
+                current one.
+        """
+        key = (tool_name, frozen_args)
+        with self._lock:
+            if generation is None:
+                generation = self.generation
+            if (payload := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                return payload
+
+        payload = _cached_renderer(tool_name).get_approval_widget(frozen_args.args)
+        with self._lock:
+            if generation == self.generation:
+                self._entries[key] = payload
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_payload_cache = _ApprovalPayloadCache(_PAYLOAD_CACHE_SIZE)
+
+
+def _approval_payload(tool_name: str, tool_args: dict[str, Any]) -> _ApprovalPayload:
+    """Get the approval widget class and a private copy of its data."""
+    try:
+        widget_class, data = _payload_cache.get(tool_name, _FrozenArgs(tool_args))
+    except TypeError:
+        # Unhashable args: render without caching
+        return _cached_renderer(tool_name).get_approval_widget(tool_args)
+    # The cached data may be the args dict itself; never share it with widgets
+    return widget_class, dict(data)
+
+
+_BASE_BINDINGS: tuple[BindingType, ...] = (
+    Binding("up", "move_up", "Up", show=False),
+    Binding("down", "move_down", "Down", show=False),
+    Binding("enter", "select", "Select", show=False),
+    Binding("1", "select_1", "Yes", show=False),
+    Binding("y", "select_1", "Yes", show=False),
+    Binding("2", "select_2", "Always Tool Session", show=False),
+    Binding("3", "select_3", "No", show=False),
+    Binding("n", "select_3", "No", show=False),
+)
+
+# Batch shortcuts; their actions are no-ops for single-tool approvals
+_BATCH_BINDINGS: tuple[BindingType, ...] = (
+    Binding("4", "select_4", "Approve All", show=False),
+    Binding("5", "select_5", "Reject All", show=False),
+)
+
+
 class ApprovalApp(Container):
     can_focus = True
     can_focus_children = False
 
-    BINDINGS: ClassVar[list[BindingType]] = [
-        Binding("up", "move_up", "Up", show=False),
-        Binding("down", "move_down", "Down", show=False),
-        Binding("enter", "select", "Select", show=False),
-        Binding("1", "select_1", "Yes", show=False),
-        Binding("y", "select_1", "Yes", show=False),
-        Binding("2", "select_2", "Always Tool Session", show=False),
-        Binding("3", "select_3", "No", show=False),
-        Binding("n", "select_3", "No", show=False),
-        Binding("4", "select_4", "Approve All", show=False),
-        Binding("5", "select_5", "Reject All", show=False),
-    ]
+    BINDINGS: ClassVar[list[BindingType]] = [*_BASE_BINDINGS, *_BATCH_BINDINGS]
+
+    # (label template, color type) per option
+    OPTIONS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Yes", "yes"),
+        ("Yes and always allow {tool_name} this session", "yes"),
+        ("No and tell the agent what to do instead", "no"),
+    )
+    # Batch shortcuts, only offered for multi-tool scenarios
+    BATCH_OPTIONS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Approve All (remaining tools)", "yes"),
+        ("Reject All (remaining tools)", "no"),
+    )
 
     class ApprovalGranted(Message):
+        __slots__ = ("action_request", "tool_args", "tool_name")
+
         def __init__(self, action_request: dict[str, Any]) -> None:
             super().__init__()
-            self.action_request = action_request
-            self.tool_name = action_request.get("name", "")
-            self.tool_args = action_request.get("args", {})
+            view = _ActionRequestView.of(action_request)
+            self.action_request = view.action_request
+            self.tool_name = view.tool_name
+            self.tool_args = view.tool_args
 
     class ApprovalGrantedAlwaysTool(Message):
+        __slots__ = ("action_request", "save_permanently", "tool_args", "tool_name")
+
         def __init__(
             self, action_request: dict[str, Any], save_permanently: bool
         ) -> None:
             super().__init__()
-            self.action_request = action_request
-            self.tool_name = action_request.get("name", "")
-            self.tool_args = action_request.get("args", {})
+            view = _ActionRequestView.of(action_request)
+            self.action_request = view.action_request
+            self.tool_name = view.tool_name
+            self.tool_args = view.tool_args
             self.save_permanently = save_permanently
 
     class ApprovalRejected(Message):
+        __slots__ = ("action_request", "tool_args", "tool_name")
+
         def __init__(self, action_request: dict[str, Any]) -> None:
             super().__init__()
-            self.action_request = action_request
-            self.tool_name = action_request.get("name", "")
-            self.tool_args = action_request.get("args", {})
+            view = _ActionRequestView.of(action_request)
+            self.action_request = view.action_request
+            self.tool_name = view.tool_name
+            self.tool_args = view.tool_args
 
     def __init__(
         self,
@@ -65,12 +263,19 @@ class ApprovalApp(Container):
         self.action_requests = action_requests
         self.current_index = current_index
         self.total_tools = len(action_requests)
-        self.max_options = 5 if self.total_tools > 1 else 3
+        # The dialog shape is fixed per instance: batch shortcuts and the
+        # follow-up tool index are resolved once instead of on every action.
+        self.is_batch = self.total_tools > 1
+        self.max_options = 5 if self.is_batch else 3
+        self.next_index = (
+            current_index + 1 if current_index + 1 < self.total_tools else None
+        )
 
         # Get current tool info
-        self.action_request = action_requests[current_index]
-        self.tool_name = self.action_request.get("name", "")
-        self.tool_args = self.action_request.get("args", {})
+        view = _ActionRequestView.of(action_requests[current_index])
+        self.action_request = view.action_request
+        self.tool_name = view.tool_name
+        self.tool_args = view.tool_args
         self.workdir = workdir
         self.config = config
         self.selected_option = 0
@@ -79,10 +284,19 @@ class ApprovalApp(Container):
         self.tool_info_container: Vertical | None = None
         self.option_widgets: list[Static] = []
         self.help_widget: Static | None = None
-
-        # Get reference to app's pending approval future
-        self.app = self.app
-        self.pending_approval_future = getattr(self.app, "_pending_approval", None)
+        # (unselected, selected) variants per option, built once in on_mount
+        self._option_texts: list[tuple[str, str]] = []
+        self._option_classes: list[tuple[tuple[str, ...], tuple[str, ...]]] = []
+        self._applied_classes: list[tuple[str, ...]] = [()] * self.max_options
+        self._pending_approval_future: asyncio.Future[dict[str, Any]] | None = None
+        self._decided = False
+
+    @property
+    def pending_approval_future(self) -> asyncio.Future[dict[str, Any]] | None:
+        """The app's pending approval future, looked up once the widget is mounted."""
+        if self._pending_approval_future is None:
+            self._pending_approval_future = getattr(self.app, "_pending_approval", None)
+        return self._pending_approval_future
 
     def compose(self) -> ComposeResult:
         with Vertical(id="approval-content"):
@@ -97,7 +311,7 @@ class ApprovalApp(Container):
 
             yield Static("")
 
-            for _ in range(5):
+            for _ in range(self.max_options):
                 widget = Static("", classes="approval-option")
                 self.option_widgets.append(widget)
                 yield widget
@@ -112,7 +326,7 @@ class ApprovalApp(Container):
     def _get_title_text(self) -> str:
         """Get title text, showing progress for multi-tool scenarios."""
         title_text = f"⚠ {self.tool_name} command"
-        if self.total_tools > 1:
+        if self.is_batch:
             title_text += f" ({self.current_index + 1}/{self.total_tools})"
         return title_text
 
@@ -123,7 +337,14 @@ class ApprovalApp(Container):
 
     async def on_mount(self) -> None:
         await self._update_tool_info()
+        if self.next_index is not None:
+            self.run_worker(
+                partial(self._prewarm_renderers, _payload_cache.generation),
+                exclusive=False,
+                thread=True,
+            )
         self._update_title()
+        self._build_option_styles()
         self._update_options()
         self.focus()
 
@@ -131,64 +352,85 @@ class ApprovalApp(Container):
         if not self.tool_info_container:
             return
 
-        renderer = get_renderer(self.tool_name)
-        widget_class, data = renderer.get_approval_widget(self.tool_args)
+        widget_class, data = _approval_payload(self.tool_name, self.tool_args)
 
-        await self.tool_info_container.remove_children()
-        approval_widget = widget_class(data)
-        await self.tool_info_container.mount(approval_widget)
+        with self.app.batch_update():
+            await self.tool_info_container.remove_children()
+            approval_widget = widget_class(data)
+            await self.tool_info_container.mount(approval_widget)
 
-    def _update_options(self) -> None:
-        options = [
-            ("Yes", "yes"),
-            (f"Yes and always allow {self.tool_name} this session", "yes"),
-            ("No and tell the agent what to do instead", "no"),
-        ]
+    def _prewarm_renderers(self, generation: int) -> None:
+        """Fill the payload cache for the next tools waiting for approval.
 
-        # Add batch shortcuts for multi-tool scenarios
-        if self.total_tools > 1:
-            options.append(("Approve All (remaining tools)", "yes"))
-            options.append(("Reject All (remaining tools)", "no"))
+        Args:
+            generation: Payload cache generation when the dialog was mounted;
+                nothing is stored once the batch is decided and the cache
+                cleared.
+        """
+        # Leave room in the cache for the payload currently on screen
+        upcoming = self.action_requests[
+            self.current_index + 1 : self.current_index + _PAYLOAD_CACHE_SIZE
+        ]
+        for action_request in upcoming:
+            if self._decided:
+                return
+            view = _ActionRequestView.of(action_request)
+            try:
+                _payload_cache.get(
+                    view.tool_name, _FrozenArgs(view.tool_args), generation
+                )
+            except TypeError:
+                _cached_renderer(view.tool_name)
+
+    def _build_option_styles(self) -> None:
+        """Precompute option texts and CSS classes for both selection states."""
+        options = self.OPTIONS + self.BATCH_OPTIONS if self.is_batch else self.OPTIONS
+
+        self._option_texts = []
+        self._option_classes = []
+        for idx, (template, color_type) in enumerate(options):
+            text = template.format(tool_name=self.tool_name)
+            color_class = f"approval-option-{color_type}"
+            self._option_texts.append((
+                f"  {idx + 1}. {text}",
+                f"› {idx + 1}. {text}",
+            ))
+            self._option_classes.append((
+                ("approval-option", "approval-option-selected", color_class),
+                ("approval-option", "approval-cursor-selected", color_class),
+            ))
+
+    def _render_option(self, idx: int) -> None:
+        is_selected = idx == self.selected_option
+        widget = self.option_widgets[idx]
+        widget.update(self._option_texts[idx][is_selected])
+
+        # Replace the class set in one pass, and only when it actually changes
+        target_classes = self._option_classes[idx][is_selected]
+        if self._applied_classes[idx] != target_classes:
+            widget.set_classes(target_classes)
+            self._applied_classes[idx] = target_classes
 
-        for idx, ((text, color_type), widget) in enumerate(
-            zip(
-                options[: self.max_options],
-                self.option_widgets[: self.max_options],
-                strict=True,
-            )
-        ):
-            is_selected = idx == self.selected_option
-
-            cursor = "› " if is_selected else "  "
-            option_text = f"{cursor}{idx + 1}. {text}"
-
-            widget.update(option_text)
-
-            widget.remove_class("approval-cursor-selected")
-            widget.remove_class("approval-option-selected")
-            widget.remove_class("approval-option-yes")
-            widget.remove_class("approval-option-no")
-
-            if is_selected:
-                widget.add_class("approval-cursor-selected")
-                if color_type == "yes":
-                    widget.add_class("approval-option-yes")
-                else:
-                    widget.add_class("approval-option-no")
-            else:
-                widget.add_class("approval-option-selected")
-                if color_type == "yes":
-                    widget.add_class("approval-option-yes")
-                else:
-                    widget.add_class("approval-option-no")
+    def _update_options(self) -> None:
+        with self.app.batch_update():
+            for idx in range(len(self._option_texts)):
+                self._render_option(idx)
+
+    def _update_selection(self, old: int, new: int) -> None:
+        """Re-render only the two options whose selected state flipped."""
+        self.selected_option = new
+        with self.app.batch_update():
+            if old != new:
+                self._render_option(old)
+            self._render_option(new)
 
     def action_move_up(self) -> None:
-        self.selected_option = (self.selected_option - 1) % self.max_options
-        self._update_options()
+        old = self.selected_option
+        self._update_selection(old, (old - 1) % self.max_options)
 
     def action_move_down(self) -> None:
-        self.selected_option = (self.selected_option + 1) % self.max_options
-        self._update_options()
+        old = self.selected_option
+        self._update_selection(old, (old + 1) % self.max_options)
 
     def action_select(self) -> None:
         self._handle_selection(self.selected_option)
@@ -207,13 +449,13 @@ class ApprovalApp(Container):
 
     def action_select_4(self) -> None:
         """Approve All shortcut (key 4)."""
-        if self.total_tools > 1:
+        if self.is_batch:
             self.selected_option = 3
             self._handle_selection(3)
 
     def action_select_5(self) -> None:
         """Reject All shortcut (key 5)."""
-        if self.total_tools > 1:
+        if self.is_batch:
             self.selected_option = 4
             self._handle_selection(4)
 
@@ -233,64 +475,50 @@ class ApprovalApp(Container):
             case 2:
                 # Reject
                 self._handle_reject()
-            case 3 if self.total_tools > 1:
+            case 3 if self.is_batch:
                 # Approve All
                 self._handle_approve_all()
-            case 4 if self.total_tools > 1:
+            case 4 if self.is_batch:
                 # Reject All
                 self._handle_reject_all()
 
     def _handle_approve(self, always_approve: bool) -> None:
         """Handle approval decision."""
-        result = {
-            "approved": True,
-            "always_approve": always_approve,
-            "feedback": None
-            if not always_approve
-            else f"Auto-approve {self.tool_name} for this session",
-        }
-
         # If more tools to approve, continue to next
-        if self.total_tools > 1 and self.current_index < self.total_tools - 1:
-            result["next_tool"] = self.current_index + 1
-
-        self._set_approval_result(result)
+        self._set_approval_result(
+            _make_result(
+                True,
+                f"Auto-approve {self.tool_name} for this session"
+                if always_approve
+                else None,
+                always_approve=always_approve,
+                next_tool=self.next_index,
+            )
+        )
 
     def _handle_reject(self) -> None:
         """Handle rejection decision."""
-        result = {
-            "approved": False,
-            "always_approve": False,
-            "feedback": "User rejected operation",
-        }
-
         # Reject current tool, but continue with others
-        if self.total_tools > 1 and self.current_index < self.total_tools - 1:
-            result["next_tool"] = self.current_index + 1
-
-        self._set_approval_result(result)
+        self._set_approval_result(
+            _make_result(False, "User rejected operation", next_tool=self.next_index)
+        )
 
     def _handle_approve_all(self) -> None:
         """Handle Approve All shortcut."""
-        result = {
-            "approved": True,
-            "always_approve": False,
-            "feedback": None,
-            "batch_approve": True,  # Signal to app
-        }
-        self._set_approval_result(result)
+        self._set_approval_result(_make_result(True, batch_approve=True))
 
     def _handle_reject_all(self) -> None:
         """Handle Reject All shortcut."""
-        result = {
-            "approved": False,
-            "always_approve": False,
-            "feedback": "User rejected all operations",
-            "batch_reject": True,  # Signal to app
-        }
-        self._set_approval_result(result)
+        self._set_approval_result(
+            _make_result(False, "User rejected all operations", batch_reject=True)
+        )
 
     def _set_approval_result(self, result: dict[str, Any]) -> None:
         """Set the approval result on the app's pending approval future."""
-        if self.pending_approval_future and not self.pending_approval_future.done():
-            self.pending_approval_future.set_result(result)
+        self._decided = True
+        if result["next_tool"] is None:
+            # No dialog follows for this batch, so drop the cached tool args
+            _payload_cache.clear()
+        future = self.pending_approval_future
+        if future is not None and not future.done():
+            future.set_result(result)
@@ -1,6 +1,21 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vibe.core.programmatic import run_programmatic
+
 __all__ = ["__version__", "run_programmatic"]
 __version__ = "1.1.3"
 
-from vibe.core.programmatic import run_programmatic
+
+def __getattr__(name: str) -> Any:
+    # run_programmatic is resolved lazily (PEP 562) so that reading
+    # ``vibe.core.__version__`` does not import the LangChain engine stack
+    if name != "run_programmatic":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from vibe.core.programmatic import run_programmatic
+
+    globals()[name] = run_programmatic
+    return run_programmatic
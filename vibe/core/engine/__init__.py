@@ -1,10 +1,22 @@
-"""Engine abstraction for Mistral Vibe - LangChain 1.2.0 powered."""
+"""Engine abstraction for Mistral Vibe - LangChain 1.2.0 powered.
+
+Exports are resolved lazily (PEP 562) so that importing a lightweight
+submodule such as ``vibe.core.engine.permissions`` does not pull in the
+whole LangChain/LangGraph stack.
+"""
 
 from __future__ import annotations
 
-from vibe.core.engine.langchain_engine import VibeLangChainEngine
-from vibe.core.engine.tools import VibeToolAdapter
-from vibe.core.engine.tui_events import TUIEventMapper
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vibe.core.engine.langchain_engine import VibeLangChainEngine
+    from vibe.core.engine.tools import VibeToolAdapter
+    from vibe.core.engine.tui_events import TUIEventMapper
+
+    # Keep VibeEngine as an alias for backward compatibility
+    VibeEngine = VibeLangChainEngine
 
 __all__ = [
     "TUIEventMapper",  # For mapping native LangGraph events
@@ -13,5 +25,25 @@ __all__ = [
     "VibeToolAdapter",
 ]
 
-# Keep VibeEngine as an alias for backward compatibility
-VibeEngine = VibeLangChainEngine
+# export name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "TUIEventMapper": ("vibe.core.engine.tui_events", "TUIEventMapper"),
+    "VibeEngine": ("vibe.core.engine.langchain_engine", "VibeLangChainEngine"),
+    "VibeLangChainEngine": (
+        "vibe.core.engine.langchain_engine",
+        "VibeLangChainEngine",
+    ),
+    "VibeToolAdapter": ("vibe.core.engine.tools", "VibeToolAdapter"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), attr_name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
@@ -0,0 +1,80 @@
+"""Bounded in-memory checkpointer for the LangChain engine."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata
+from langgraph.checkpoint.memory import InMemorySaver
+
+# Checkpoints kept per thread; resuming and get_state() only need the newest
+DEFAULT_MAX_CHECKPOINTS = 32
+
+
+class BoundedInMemorySaver(InMemorySaver):
+    """InMemorySaver that keeps only the newest checkpoints of each thread.
+
+    Every graph step stores a full checkpoint, so a long session would
+    otherwise keep every intermediate state alive. Older checkpoints are
+    dropped together with their pending writes and any channel blobs that
+    no retained checkpoint still references.
+    """
+
+    def __init__(
+        self, *, max_checkpoints: int = DEFAULT_MAX_CHECKPOINTS, **kwargs: Any
+    ) -> None:
+        if max_checkpoints < 1:
+            raise ValueError("max_checkpoints must be at least 1")
+        super().__init__(**kwargs)
+        self.max_checkpoints = max_checkpoints
+        # (thread_id, checkpoint_ns, checkpoint_id) -> channel_versions
+        self._channel_versions: dict[tuple[str, str, str], ChannelVersions] = {}
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        configurable = saved.get("configurable", {})
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable["checkpoint_ns"]
+        self._channel_versions[thread_id, checkpoint_ns, checkpoint["id"]] = dict(
+            checkpoint["channel_versions"]
+        )
+        self._evict(thread_id, checkpoint_ns)
+        return saved
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        for key in [key for key in self._channel_versions if key[0] == thread_id]:
+            del self._channel_versions[key]
+
+    def _evict(self, thread_id: str, checkpoint_ns: str) -> None:
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        excess = len(checkpoints) - self.max_checkpoints
+        if excess <= 0:
+            return
+
+        # Checkpoint ids sort chronologically (InMemorySaver picks max() as latest)
+        evicted = sorted(checkpoints)[:excess]
+        evicted_versions: set[tuple[str, Any]] = set()
+        for checkpoint_id in evicted:
+            del checkpoints[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            versions = self._channel_versions.pop(
+                (thread_id, checkpoint_ns, checkpoint_id), {}
+            )
+            evicted_versions.update(versions.items())
+
+        for checkpoint_id in checkpoints:
+            versions = self._channel_versions.get(
+                (thread_id, checkpoint_ns, checkpoint_id), {}
+            )
+            evicted_versions.difference_update(versions.items())
+
+        for channel, version in evicted_versions:
+            self.blobs.pop((thread_id, checkpoint_ns, channel, version), None)
@@ -2,38 +2,97 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
-from typing import Any, cast
+import asyncio
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import aclosing
+import time
+from typing import TYPE_CHECKING, Any, Final
 from uuid import uuid4
 
-from langchain.agents import create_agent
-from langchain.agents.middleware import HumanInTheLoopMiddleware
-from langchain.agents.middleware.human_in_the_loop import Decision, HITLResponse
-from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.messages import (
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    ToolMessage,
+)
 from langchain_core.runnables import RunnableConfig
-from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 
 from vibe.core.config import VibeConfig
-from vibe.core.engine.langchain_middleware import (
-    ContextWarningMiddleware,
-    LoggerMiddleware,
-    PriceLimitMiddleware,
-)
-from vibe.core.engine.state import VibeAgentState
+from vibe.core.engine.checkpointer import BoundedInMemorySaver
 from vibe.core.engine.tools import VibeToolAdapter
 from vibe.core.engine.tui_events import TUIEventMapper
 from vibe.core.interaction_logger import InteractionLogger
-from vibe.core.types import AgentStats, LLMMessage
+from vibe.core.tools.manager import ToolManager
+from vibe.core.types import AgentStats, AssistantEvent, LLMMessage, Role
+
+# langchain.agents (create_agent, middleware, HITL types) is imported where it
+# is used: it is the heaviest import here and is only needed once a
+# conversation actually starts
+if TYPE_CHECKING:
+    from langchain.agents.middleware.human_in_the_loop import (
+        ApproveDecision,
+        Decision,
+        RejectDecision,
+    )
+    from langchain.agents.middleware.types import AgentMiddleware
+    from langgraph.graph.state import CompiledStateGraph
 
 # Default message used when a tool operation is rejected by the user
 _DEFAULT_REJECTION_MESSAGE = "Operation rejected by user"
 
+# Approve decisions carry no per-tool data, so every resume shares this one
+_APPROVE_DECISION: Final[ApproveDecision] = {"type": "approve"}
+
+_EMPTY: Mapping[str, Any] = {}
+
+# Run types whose astream_events output is consumed by run()
+_STREAMED_RUN_TYPES = ["chat_model", "tool"]
+
+# Events buffered between the graph and run()'s caller; a slow caller applies
+# backpressure to the graph once this many events are waiting. Streamed text
+# travels as plain str items, which run() merges into AssistantEvents.
+_STREAM_QUEUE_SIZE = 256
+
+# Queue item marking the end of a turn's events
+_STREAM_DONE: Any = object()
+
+
+def _reject_decision(feedback: str | None) -> RejectDecision:
+    return {"type": "reject", "message": feedback or _DEFAULT_REJECTION_MESSAGE}
+
+
+class _StreamFailure:
+    """Queue item carrying an exception raised while streaming a turn."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
 
 class VibeEngineStats:
     """Statistics implementation for VibeLangChainEngine that matches AgentStats interface."""
 
+    __slots__ = (
+        "_messages",
+        "_todos",
+        "context_tokens",
+        "input_price_per_million",
+        "last_turn_completion_tokens",
+        "last_turn_duration",
+        "last_turn_prompt_tokens",
+        "output_price_per_million",
+        "session_completion_tokens",
+        "session_prompt_tokens",
+        "steps",
+        "tokens_per_second",
+        "tool_calls_agreed",
+        "tool_calls_failed",
+        "tool_calls_rejected",
+        "tool_calls_succeeded",
+    )
+
     def __init__(
         self, messages: int = 0, context_tokens: int = 0, todos: list[Any] | None = None
     ) -> None:
@@ -86,15 +145,44 @@ class VibeLangChainEngine:
     ) -> None:
         self.config = config
         self._agent: CompiledStateGraph | None = None
-        self._checkpointer = InMemorySaver()
-        self._thread_id = f"vibe-session-{uuid4()}"
+        self._checkpointer = BoundedInMemorySaver()
+        self._start_thread()
         self._stats = VibeEngineStats()
         self._tui_event_mapper: TUIEventMapper | None = None
+        self._tool_manager: ToolManager | None = None
+        self._system_prompt: str | None = None
+        self._interrupt_on: dict[str, Any] | None = None
+        # set when the compiled graph was built from an outdated interrupt config
+        self._agent_stale = False
+        self._pricing: dict[str, tuple[float, float]] | None = None
+        # message id -> usage_metadata token count, see _get_actual_token_count()
+        self._token_cache: dict[str, int] = {}
+        # monotonic start of the in-flight model call, for tokens_per_second
+        self._model_call_started = 0.0
+        # successful tool results already counted into stats.steps, see
+        # _sync_stats_from_state()
+        self._synced_tool_ids: set[str] = set()
+        self._synced_steps = 0
         # Session logging
         self._interaction_logger: InteractionLogger | None = None
         self._messages: list[LLMMessage] = []
         self._initialize_session_logger()
 
+    def _start_thread(self) -> None:
+        """Start a new conversation thread and build the configs targeting it.
+
+        The configs only change with the thread, so they are shared by every
+        run, resume and state access on it instead of being rebuilt per call.
+        """
+        self._thread_id = f"vibe-session-{uuid4()}"
+        self._state_config: RunnableConfig = {
+            "configurable": {"thread_id": self._thread_id}
+        }
+        self._run_config: RunnableConfig = {
+            **self._state_config,
+            "recursion_limit": self.config.max_recursion_depth,
+        }
+
     def _initialize_session_logger(self) -> None:
         """Initialize the session logger if logging is enabled."""
         if self.config.session_logging.enabled:
@@ -110,13 +198,11 @@ class VibeLangChainEngine:
                 self._interaction_logger = None
 
     @property
-    def session_id(self) -> str:
-        """Get the current session ID."""
-        return self._thread_id
-
-    def get_current_messages(self) -> list[LLMMessage]:
-        """Get the current conversation messages."""
-        return self._messages.copy()
+    def tool_manager(self) -> ToolManager:
+        """Tool manager shared by the system prompt, event mapper and session log."""
+        if self._tool_manager is None:
+            self._tool_manager = ToolManager(self.config)
+        return self._tool_manager
 
     async def save_session(self) -> str | None:
         """Save the current session to disk.
@@ -128,11 +214,6 @@ class VibeLangChainEngine:
             return None
 
         try:
-            from vibe.core.tools.manager import ToolManager
-            from vibe.core.types import AgentStats
-
-            tool_manager = ToolManager(self.config)
-
             # Convert VibeEngineStats to AgentStats
             stats = AgentStats(
                 steps=self._stats.steps,
@@ -155,7 +236,7 @@ class VibeLangChainEngine:
                 messages=self._messages,
                 stats=stats,
                 config=self.config,
-                tool_manager=tool_manager,
+                tool_manager=self.tool_manager,
             )
         except Exception:
             return None
@@ -167,26 +248,33 @@ class VibeLangChainEngine:
         return create_model_from_config(self.config)
 
     def _get_system_prompt(self) -> str:
-        """Build system prompt from Vibe config."""
-        from vibe.core.system_prompt import get_universal_system_prompt
-        from vibe.core.tools.manager import ToolManager
+        """Build system prompt from Vibe config, once per engine.
 
-        tool_manager = ToolManager(self.config)
-        return get_universal_system_prompt(tool_manager, self.config)
+        The prompt only depends on the config, so it is reused across reset().
+        """
+        if self._system_prompt is None:
+            from vibe.core.system_prompt import get_universal_system_prompt
+
+            self._system_prompt = get_universal_system_prompt(
+                self.tool_manager, self.config
+            )
+        return self._system_prompt
 
     def _get_pricing_config(self) -> dict[str, tuple[float, float]]:
-        """Get pricing configuration from model configs.
+        """Get pricing configuration from model configs, once per engine.
 
         Returns dict mapping model names to (input_rate, output_rate) tuples.
         Rates are per-token (not per-million-tokens).
         """
-        pricing = {}
-        for model_config in self.config.models:
-            pricing[model_config.name] = (
-                model_config.input_price / 1_000_000,
-                model_config.output_price / 1_000_000,
-            )
-        return pricing
+        if self._pricing is None:
+            self._pricing = {
+                model_config.name: (
+                    model_config.input_price / 1_000_000,
+                    model_config.output_price / 1_000_000,
+                )
+                for model_config in self.config.models
+            }
+        return self._pricing
 
     def _get_tui_event_mapper(self) -> TUIEventMapper:
         """Lazy initialization of TUI event mapper.
@@ -195,11 +283,43 @@ class VibeLangChainEngine:
             TUIEventMapper instance for mapping native events to Vibe TUI events
         """
         if self._tui_event_mapper is None:
-            self._tui_event_mapper = TUIEventMapper(self.config)
+            self._tui_event_mapper = TUIEventMapper(
+                self.config, tool_manager=self.tool_manager
+            )
         return self._tui_event_mapper
 
+    def _get_interrupt_config(self) -> dict[str, Any]:
+        """Return the HITL interrupt config, built once from the tool permissions.
+
+        Call `invalidate_interrupt_cache()` after changing `config.tools`.
+        """
+        if self._interrupt_on is None:
+            from vibe.core.engine.permissions import build_interrupt_config
+
+            self._interrupt_on = build_interrupt_config(self.config)
+        return self._interrupt_on
+
+    def invalidate_interrupt_cache(self) -> None:
+        """Drop the cached interrupt config and rebuild the agent before the next turn.
+
+        The interrupt config is baked into the compiled HITL middleware, so the
+        change only applies once the graph is rebuilt. The current graph is
+        kept until then, as a pending approval still has to resume on it; the
+        checkpointer and thread are reused, so the history carries over.
+        """
+        self._interrupt_on = None
+        self._agent_stale = self._agent is not None
+
     def _build_middleware_stack(self) -> list[AgentMiddleware]:
         """Build the custom middleware stack for LangChain 1.2.0."""
+        from langchain.agents.middleware import HumanInTheLoopMiddleware
+
+        from vibe.core.engine.langchain_middleware import (
+            ContextWarningMiddleware,
+            LoggerMiddleware,
+            PriceLimitMiddleware,
+        )
+
         middleware: list[AgentMiddleware] = []
 
         # Context warnings (Vibe-specific)
@@ -226,9 +346,7 @@ class VibeLangChainEngine:
             )
 
         # Human-in-the-loop (native LangChain 1.2.0)
-        from vibe.core.engine.permissions import build_interrupt_config
-
-        interrupt_on = build_interrupt_config(self.config)
+        interrupt_on = self._get_interrupt_config()
         if interrupt_on:
             middleware.append(
                 HumanInTheLoopMiddleware(
@@ -237,18 +355,25 @@ class VibeLangChainEngine:
                 )
             )
 
-        # Logger middleware for observability
-        middleware.append(LoggerMiddleware(enabled=self.config.agent_logging_enabled))
+        # Logger middleware for observability. When disabled it is left out
+        # entirely, so its hooks add no nodes or wrappers to the graph.
+        if self.config.agent_logging_enabled:
+            middleware.append(LoggerMiddleware())
 
         return middleware
 
     def initialize(self) -> None:
         """Initialize the LangChain 1.2.0 agent."""
+        from langchain.agents import create_agent
+
+        from vibe.core.engine.state import VibeAgentState
+
         model = self._create_model()
         tools = VibeToolAdapter.get_all_tools(self.config)
 
         # LangChain 1.2.0 create_agent() with native middleware stack
 
+        self._agent_stale = False
         self._agent = create_agent(
             model=model,
             tools=tools,
@@ -258,51 +383,128 @@ class VibeLangChainEngine:
             checkpointer=self._checkpointer,
         )
 
+    async def _ensure_agent(self) -> None:
+        """Build the agent if needed, off the event loop.
+
+        After reset() or invalidate_interrupt_cache() the next turn rebuilds
+        the graph; doing that in a worker thread keeps the UI responsive while
+        the model and graph are built.
+        """
+        if self._agent is None or self._agent_stale:
+            await asyncio.to_thread(self.initialize)
+
     async def run(self, user_message: str) -> AsyncGenerator[Any, None]:
         """Run a conversation turn, yielding mapped Vibe TUI events.
 
         This method streams native LangGraph events through TUIEventMapper
         to convert them to Vibe TUI event types that EventHandler expects.
+        The graph is consumed by a background task feeding a bounded queue,
+        so the model stream keeps flowing while the caller renders events.
         """
-        if self._agent is None:
-            self.initialize()
-
-        assert self._agent is not None
+        await self._ensure_agent()
 
-        config: RunnableConfig = {
-            "configurable": {"thread_id": self._thread_id},
-            "recursion_limit": self.config.max_recursion_depth,
-        }
-
-        messages = [("user", user_message)]
+        # A ready-made message skips LangChain's tuple-to-message coercion
+        messages: list[BaseMessage] = [HumanMessage(content=user_message)]
 
         # Track user message
-        self._messages.append(LLMMessage(role="user", content=user_message))
+        self._messages.append(LLMMessage(role=Role.user, content=user_message))
+        self._stats._messages += 1
 
-        mapper = self._get_tui_event_mapper()
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        producer = asyncio.create_task(self._pump_events(messages, queue))
+        turn_started = time.monotonic()
 
         try:
-            # Stream native LangGraph events and map to Vibe TUI events
-            async for event in self._agent.astream_events(
-                {"messages": messages}, config=config, version="v2"
-            ):
-                # Update stats incrementally from event data
-                self._update_stats_from_event(event)
-
-                mapped_event = mapper.map_event(event)
-                if mapped_event is not None:
-                    # Track assistant messages
-                    from vibe.core.types import AssistantEvent
-
-                    if isinstance(mapped_event, AssistantEvent):
-                        self._messages.append(
-                            LLMMessage(role="assistant", content=mapped_event.content)
-                        )
-                    yield mapped_event
+            held: Any = None
+            while True:
+                item = held if held is not None else await queue.get()
+                held = None
+                if item is _STREAM_DONE:
+                    break
+                if isinstance(item, _StreamFailure):
+                    raise item.error
+                if type(item) is str:
+                    # Text that queued up while the caller was busy goes out as
+                    # one AssistantEvent; nothing ever waits for more to arrive
+                    content, held = self._drain_text(queue, item)
+                    yield self._assistant_event(content)
+                else:
+                    yield item
         finally:
+            # Stop the graph if the caller stopped consuming (cancel or close)
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            self._stats.last_turn_duration = time.monotonic() - turn_started
+            self._sync_stats_from_state()
             # Save session when run completes
             await self.save_session()
 
+    async def _pump_events(
+        self, messages: list[BaseMessage], queue: asyncio.Queue[Any]
+    ) -> None:
+        """Feed the mapped events of a turn into `queue`, then `_STREAM_DONE`."""
+        try:
+            async with aclosing(self._stream_events(messages)) as events:
+                async for event in events:
+                    await queue.put(event)
+        except Exception as e:
+            await queue.put(_StreamFailure(e))
+        else:
+            await queue.put(_STREAM_DONE)
+
+    async def _stream_events(
+        self, messages: list[BaseMessage]
+    ) -> AsyncGenerator[Any, None]:
+        """Stream native LangGraph events of a turn as Vibe TUI events.
+
+        Streamed model text is yielded as plain str chunks for run() to merge.
+        """
+        assert self._agent is not None
+
+        mapper = self._get_tui_event_mapper()
+
+        # Stream native LangGraph events and map to Vibe TUI events. Only
+        # chat model and tool runs feed the mapper and stats, so have the
+        # graph drop chain/middleware events before they are dispatched.
+        async for event in self._agent.astream_events(
+            {"messages": messages},
+            config=self._run_config,
+            version="v2",
+            include_types=_STREAMED_RUN_TYPES,
+        ):
+            # Token chunks dominate the stream and carry no stats, so only
+            # their text is passed on; run() merges consecutive chunks
+            if event["event"] == "on_chat_model_stream":
+                if (text := mapper.chunk_text(event)) is not None:
+                    yield text
+                continue
+
+            # Update stats incrementally from event data
+            self._update_stats_from_event(event)
+            mapped_event = mapper.map_event(event)
+            if mapped_event is not None:
+                yield mapped_event
+
+    @staticmethod
+    def _drain_text(queue: asyncio.Queue[Any], first: str) -> tuple[str, Any]:
+        """Join `first` with the text chunks already queued behind it.
+
+        Returns the joined text and the non-text item that ended the run of
+        chunks, or None if the queue ran empty first.
+        """
+        chunks = [first]
+        while not queue.empty():
+            item = queue.get_nowait()
+            if type(item) is not str:
+                return "".join(chunks), item
+            chunks.append(item)
+        return "".join(chunks), None
+
+    def _assistant_event(self, content: str) -> AssistantEvent:
+        """Turn merged streamed text into one tracked AssistantEvent."""
+        self._messages.append(LLMMessage(role=Role.assistant, content=content))
+        return AssistantEvent(content=content)
+
     async def handle_approval(
         self, approved: bool, feedback: str | None = None
     ) -> None:
@@ -325,23 +527,10 @@ class VibeLangChainEngine:
 
         logger.info(msg)
 
-        config: RunnableConfig = {"configurable": {"thread_id": self._thread_id}}
-
         # Build HITLResponse with proper Decision format
-        if approved:
-            hitl_response = HITLResponse(decisions=[{"type": "approve"}])
-        else:
-            hitl_response = HITLResponse(
-                decisions=[
-                    {
-                        "type": "reject",
-                        "message": feedback or _DEFAULT_REJECTION_MESSAGE,
-                    }
-                ]
-            )
-
-        # Resume with HITLResponse
-        await self._agent.ainvoke(Command(resume=hitl_response), config=config)
+        await self._resume_with_decisions([
+            _APPROVE_DECISION if approved else _reject_decision(feedback)
+        ])
 
     async def handle_multi_tool_approval(
         self,
@@ -365,21 +554,12 @@ class VibeLangChainEngine:
                 f"Length mismatch: {len(approvals)} approvals vs {len(feedbacks)} feedbacks"
             )
 
-        config: RunnableConfig = {"configurable": {"thread_id": self._thread_id}}
-
         # Build decisions list using list comprehension
-        decisions = [
-            {"type": "approve"}
-            if approved
-            else {
-                "type": "reject",
-                "message": feedback or _DEFAULT_REJECTION_MESSAGE,
-            }
+        decisions: list[Decision] = [
+            _APPROVE_DECISION if approved else _reject_decision(feedback)
             for approved, feedback in zip(approvals, feedbacks, strict=True)
         ]
-
-        hitl_response = HITLResponse(decisions=cast("list[Decision]", decisions))
-        await self._agent.ainvoke(Command(resume=hitl_response), config=config)
+        await self._resume_with_decisions(decisions)
 
     async def handle_approve_all(self, tool_count: int) -> None:
         """Approve all interrupted tools.
@@ -387,9 +567,7 @@ class VibeLangChainEngine:
         Args:
             tool_count: Number of tools to approve
         """
-        approvals = [True] * tool_count
-        feedbacks: list[str | None] = [None] * tool_count
-        await self.handle_multi_tool_approval(approvals, feedbacks)
+        await self._resume_with_decisions([_APPROVE_DECISION] * tool_count)
 
     async def handle_reject_all(
         self,
@@ -402,36 +580,67 @@ class VibeLangChainEngine:
             tool_count: Number of tools to reject
             feedback: Rejection feedback (applied to all)
         """
-        approvals = [False] * tool_count
-        feedbacks: list[str | None] = [feedback] * tool_count
-        await self.handle_multi_tool_approval(approvals, feedbacks)
+        await self._resume_with_decisions([_reject_decision(feedback)] * tool_count)
+
+    async def _resume_with_decisions(self, decisions: list[Decision]) -> None:
+        """Resume the interrupted graph with one HITL decision per tool."""
+        if self._agent is None:
+            return
+
+        from langchain.agents.middleware.human_in_the_loop import HITLResponse
+
+        await self._agent.ainvoke(
+            Command(resume=HITLResponse(decisions=decisions)),
+            config=self._state_config,
+        )
+        # ainvoke() streams no events, so the resumed part of the turn only
+        # shows up in the stored state
+        self._sync_stats_from_state()
 
     def reset(self) -> None:
         """Reset conversation state."""
-        self._checkpointer = InMemorySaver()
-        self._thread_id = f"vibe-session-{uuid4()}"
+        self._checkpointer = BoundedInMemorySaver()
+        self._start_thread()
         self._agent = None
+        self._token_cache.clear()
+        self._synced_tool_ids.clear()
+        self._stats._messages = 0
 
     def compact(self) -> str:
         """Compact conversation history to reduce context size."""
         if self._agent is None:
             return "No active conversation to compact"
 
-        state = self._agent.get_state({"configurable": {"thread_id": self._thread_id}})
+        state = self._agent.get_state(self._state_config)
         messages = state.values.get("messages", [])
 
         if len(messages) <= 1:
             return "No messages to compact"
 
         keep_count = max(1, len(messages) // 2)
-        compacted_messages = messages[-keep_count:]
+        cut = len(messages) - keep_count
+        # Don't start the kept history with tool results whose calling AI
+        # message is being dropped
+        while cut < len(messages) - 1 and isinstance(messages[cut], ToolMessage):
+            cut += 1
 
         old_tokens = self._get_actual_token_count(messages)
-        new_tokens = self._get_actual_token_count(compacted_messages)
 
-        # Update state with compacted messages
-        config: RunnableConfig = {"configurable": {"thread_id": self._thread_id}}
-        self._agent.update_state(config, {"messages": compacted_messages})
+        # The add_messages reducer only merges by id, so the dropped head has
+        # to be removed explicitly
+        self._agent.update_state(
+            self._state_config,
+            {"messages": [RemoveMessage(id=msg.id) for msg in messages[:cut]]},
+        )
+
+        # Recount from the state that was actually stored
+        compacted_messages = self._sync_stats_from_state()
+        new_tokens = self._stats.context_tokens
+        self._token_cache = {
+            msg.id: self._token_cache[msg.id]
+            for msg in compacted_messages
+            if msg.id in self._token_cache
+        }
 
         return f"Compacted {len(messages)} messages to {len(compacted_messages)} messages, reducing tokens from {old_tokens} to {new_tokens}"
 
@@ -442,9 +651,7 @@ class VibeLangChainEngine:
     def get_current_messages(self) -> list:
         """Get the current conversation messages from the agent state."""
         if self._agent is not None:
-            state = self._agent.get_state({
-                "configurable": {"thread_id": self._thread_id}
-            })
+            state = self._agent.get_state(self._state_config)
             return state.values.get("messages", [])
         return []
 
@@ -461,31 +668,64 @@ class VibeLangChainEngine:
     def stats(self) -> VibeEngineStats:
         """Get current session statistics.
 
-        Note: Stats are updated incrementally during event streaming.
-        This property now simply returns the current stats state.
+        Stats, including the message count, are updated incrementally while
+        events stream and reconciled with the stored history once per turn,
+        so reading them never touches the checkpointer.
         """
-        # Keep message count for backward compatibility with UI
-        # (context_tokens is already updated incrementally in run())
-        if self._agent is not None:
-            state = self._agent.get_state({
-                "configurable": {"thread_id": self._thread_id}
-            })
-            messages = state.values.get("messages", [])
-            self._stats._messages = len(messages)
-
         return self._stats
 
     def _get_actual_token_count(self, messages: list) -> int:
-        """Get actual token count from usage metadata (no estimation!)."""
+        """Get actual token count from usage metadata (no estimation!).
+
+        Counts are cached by message id: the checkpointer hands back fresh
+        message objects on every read, but a message's usage never changes.
+        """
         total_tokens = 0
+        cache = self._token_cache
         for msg in messages:
-            if hasattr(msg, "usage_metadata") and msg.usage_metadata:
-                usage = msg.usage_metadata
-                total_tokens += usage.get("input_tokens", 0)
-                total_tokens += usage.get("output_tokens", 0)
+            msg_id = getattr(msg, "id", None)
+            tokens = cache.get(msg_id) if msg_id is not None else None
+            if tokens is None:
+                tokens = 0
+                if usage := getattr(msg, "usage_metadata", None):
+                    tokens = usage.get("input_tokens", 0) + usage.get(
+                        "output_tokens", 0
+                    )
+                if msg_id is not None:
+                    cache[msg_id] = tokens
+            total_tokens += tokens
         return total_tokens
 
-    def _update_stats_from_event(self, event: dict[str, Any] | object) -> None:
+    def _sync_stats_from_state(self) -> list[BaseMessage]:
+        """Reconcile the history-derived stats with the stored conversation.
+
+        The counters updated from events drift from the checkpoint: resumed
+        approvals run without events, rejected tools never end, and messages
+        can replace earlier ones by id. This is called once per turn, resume
+        and compaction, so reading stats still never touches the checkpointer.
+
+        Returns:
+            The messages currently stored for the thread.
+        """
+        assert self._agent is not None
+
+        messages = self._agent.get_state(self._state_config).values.get("messages", [])
+        for msg in messages:
+            if (
+                isinstance(msg, ToolMessage)
+                and msg.status == "success"
+                and msg.id is not None
+                and msg.id not in self._synced_tool_ids
+            ):
+                self._synced_tool_ids.add(msg.id)
+                self._synced_steps += 1
+
+        self._stats.steps = self._synced_steps
+        self._stats.context_tokens = self._get_actual_token_count(messages)
+        self._stats._messages = len(messages)
+        return messages
+
+    def _update_stats_from_event(self, event: Mapping[str, Any]) -> None:
         """Update stats incrementally from LangGraph event data.
 
         This method extracts relevant information from LangGraph events
@@ -493,27 +733,16 @@ class VibeLangChainEngine:
         from the full agent state.
 
         Args:
-            event: A dictionary or StreamEvent object representing a LangGraph event
-                from astream_events(). Events can be dicts or objects with __dict__.
+            event: A LangGraph event from astream_events(). v2 StreamEvents
+                are plain dicts, so they are read directly.
         """
-        # Handle both dict and object types from astream_events
-        # Events from LangGraph's astream_events can be dicts or StreamEvent objects
-        if isinstance(event, dict):
-            event_data = event
-        elif hasattr(event, "__dict__"):
-            event_data = event.__dict__
-        else:
-            # Fallback for events without __dict__ attribute
-            event_data = {}
-
-        event_type = event_data.get("event", "")
+        event_type = event.get("event")
 
         # Handle chat model completion events (token usage)
         if event_type == "on_chat_model_end":
-            output = event_data.get("data", {}).get("output", {})
+            output = (event.get("data") or _EMPTY).get("output")
             # The output is typically an AIMessage with usage_metadata
-            if hasattr(output, "usage_metadata") and output.usage_metadata:
-                usage = output.usage_metadata
+            if usage := getattr(output, "usage_metadata", None):
                 input_tokens = usage.get("input_tokens", 0)
                 output_tokens = usage.get("output_tokens", 0)
 
@@ -528,6 +757,18 @@ class VibeLangChainEngine:
                 # Update context tokens incrementally
                 self._stats.context_tokens += input_tokens + output_tokens
 
+                # Generation speed of this model call, start to last token
+                elapsed = time.monotonic() - self._model_call_started
+                if self._model_call_started and elapsed > 0:
+                    self._stats.tokens_per_second = output_tokens / elapsed
+
+            # Every completed model call adds one AI message to the history
+            self._stats._messages += 1
+
         # Handle tool completion events (step tracking)
         elif event_type == "on_tool_end":
             self._stats.steps += 1
+            self._stats._messages += 1
+
+        elif event_type == "on_chat_model_start":
+            self._model_call_started = time.monotonic()
@@ -11,6 +11,7 @@ These middleware classes are implemented natively with LangChain 1.2.0.
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
+import logging
 from typing import TYPE_CHECKING, Any
 
 from langchain.agents.middleware.types import (  # type: ignore
@@ -57,6 +58,10 @@ class ContextWarningMiddleware(AgentMiddleware):
         """
         self.threshold_percent = threshold_percent
         self.max_context = max_context
+        # Token count at which to warn, fixed for the middleware's lifetime
+        self._threshold_tokens = (
+            max_context * threshold_percent if max_context is not None else 0.0
+        )
         self._warned = False
         self._cumulative_tokens = 0
 
@@ -78,7 +83,7 @@ class ContextWarningMiddleware(AgentMiddleware):
         # Get actual token count from usage metadata if available
         current_tokens = self._get_current_token_count(state)
 
-        if current_tokens >= self.max_context * self.threshold_percent:
+        if current_tokens >= self._threshold_tokens:
             self._warned = True
             warning_message = self._create_warning(current_tokens, self.max_context)
             return {"warning": warning_message}
@@ -130,21 +135,21 @@ class ContextWarningMiddleware(AgentMiddleware):
         Returns:
             Estimated token count
         """
-        total_chars = 0
+        # Gather the text pieces first so the length sum runs in C via map(len)
+        texts: list[str] = []
+        append = texts.append
         for msg in messages:
             content = getattr(msg, "content", msg)
             if isinstance(content, str):
-                total_chars += len(content)
-            elif isinstance(content, list):
-                # Handle multi-part content (e.g., vision models)
-                for part in content:
-                    if isinstance(part, str):
-                        total_chars += len(part)
-                    elif isinstance(part, dict) and "text" in part:
-                        total_chars += len(str(part.get("text", "")))
-            elif isinstance(content, dict) and "text" in content:
-                total_chars += len(str(content.get("text", "")))
-        return total_chars // 4
+                append(content)
+                continue
+            # Handle multi-part content (e.g., vision models) and single parts alike
+            for part in content if isinstance(content, list) else (content,):
+                if isinstance(part, str):
+                    append(part)
+                elif isinstance(part, dict) and "text" in part:
+                    append(str(part["text"]))
+        return sum(map(len, texts)) // 4
 
     def _create_warning(self, current_tokens: int, max_tokens: int) -> str:
         """Create a formatted warning message.
@@ -199,6 +204,9 @@ class PriceLimitMiddleware(AgentMiddleware):
         self.max_price = max_price
         self.model_name = model_name
         self.pricing = pricing or {}  # model_name -> (input_rate, output_rate)
+        # The model is fixed for the middleware's lifetime, so resolve its
+        # rates once instead of on every model call
+        self._input_rate, self._output_rate = self.pricing.get(model_name, (0.0, 0.0))
         self._total_cost = 0.0
 
     def before_model(
@@ -223,15 +231,13 @@ class PriceLimitMiddleware(AgentMiddleware):
         # Get the latest AI message from state
         messages = state.get("messages", [])
         if messages and isinstance(messages[-1], AIMessage):
-            latest_response = messages[-1]
-            if latest_response.usage_metadata:
-                # Get pricing for the model using stored model_name
-                input_rate, output_rate = self.pricing.get(self.model_name, (0.0, 0.0))
-
+            if usage := messages[-1].usage_metadata:
                 # Calculate cost using actual token counts
-                input_tokens = latest_response.usage_metadata.get("input_tokens", 0)
-                output_tokens = latest_response.usage_metadata.get("output_tokens", 0)
-                cost = (input_tokens * input_rate) + (output_tokens * output_rate)
+                input_tokens = usage.get("input_tokens", 0)
+                output_tokens = usage.get("output_tokens", 0)
+                cost = (
+                    input_tokens * self._input_rate + output_tokens * self._output_rate
+                )
                 self._total_cost += cost
 
                 # Check limit
@@ -304,6 +310,8 @@ class LoggerMiddleware(AgentMiddleware):
 
     def _log_model_request(self, request: ModelRequest) -> None:
         """Logs model request details."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         model_name = getattr(request.model, "model_name", "unknown")
         message_count = len(request.messages)
         tools_count = len(request.tools) if request.tools else 0
@@ -313,6 +321,8 @@ class LoggerMiddleware(AgentMiddleware):
 
     def _log_model_response(self, response: ModelResponse) -> None:
         """Logs model response details, including token usage."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if response.result:
             usage = getattr(response.result[0], "usage_metadata", None)
             if usage:
@@ -424,10 +434,15 @@ class LoggerMiddleware(AgentMiddleware):
 
     def _log_tool_request(self, tool_name: str, tool_args: dict) -> None:
         """Logs tool call request details."""
+        # Skip formatting the arguments and result entirely when INFO is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"[TOOL CALL] {tool_name}({tool_args})")
 
     def _log_tool_result(self, tool_name: str, result: Any) -> None:
         """Logs tool call result, with truncation."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         content = result.content if isinstance(result, ToolMessage) else result
         truncated_result = self._truncate_result(content)
         logger.info(f"[TOOL RESULT] {tool_name}: {truncated_result}")
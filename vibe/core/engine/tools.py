@@ -189,7 +189,8 @@ class VibeToolAdapter:
                     stderr=asyncio.subprocess.STDOUT,
                     cwd=cwd,
                 )
-                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+                async with asyncio.timeout(timeout):
+                    stdout, _ = await proc.communicate()
                 output = stdout.decode("utf-8", errors="replace")
                 return f"Exit code: {proc.returncode}\n{output}"
             except TimeoutError:
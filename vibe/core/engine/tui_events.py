@@ -9,6 +9,7 @@ This replaces the EventTranslator adapter layer from LangChain 1.2.0 migration.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ValidationError
@@ -41,6 +42,23 @@ class GenericResult(BaseModel):
     output: str = ""
 
 
+# Shared fallback for missing event payloads; must never be mutated.
+_EMPTY: dict[str, Any] = {}
+
+# Cache-miss marker, since None is a valid cached value for unknown tools
+_MISSING: Any = object()
+
+
+def _generic_args(tool_args: Any) -> GenericArgs:
+    """Wrap raw tool args in GenericArgs without re-running pydantic validation."""
+    # model_construct keeps the given object, so never hand out the shared sentinel
+    return GenericArgs.model_construct(args={} if tool_args is _EMPTY else tool_args)
+
+
+# (tool class, args model, result model) of a known tool
+_ToolInfo = tuple["type[BaseTool]", type[BaseModel], type[BaseModel]]
+
+
 class TUIEventMapper:
     """Map native LangGraph events to Vibe TUI events.
 
@@ -62,14 +80,34 @@ class TUIEventMapper:
                 await handler.handle_event(mapped)
     """
 
-    def __init__(self, config: VibeConfig) -> None:
+    def __init__(
+        self, config: VibeConfig, tool_manager: ToolManager | None = None
+    ) -> None:
         """Initialize the event mapper with configuration.
 
         Args:
             config: VibeConfig containing tool definitions and permissions
+            tool_manager: Optional ToolManager to share with the caller; one is
+                created lazily from the config otherwise
         """
         self.config = config
-        self.tool_manager = ToolManager(config)
+        self._tool_manager = tool_manager
+        # tool name -> tool info (None for unknown tools), resolved on first use
+        self._tool_info_cache: dict[str, _ToolInfo | None] = {}
+        self._handlers: dict[str, Callable[[dict[str, Any]], BaseEvent | None]] = {
+            "on_chat_model_stream": self.map_chat_model_stream,
+            "on_tool_start": self._map_tool_start,
+            "on_tool_end": self._map_tool_end,
+            "on_tool_error": self._map_tool_error,
+            "on_interrupt": self._map_interrupt_event,
+        }
+
+    @property
+    def tool_manager(self) -> ToolManager:
+        """Tool manager used to resolve tool classes, created on first access."""
+        if self._tool_manager is None:
+            self._tool_manager = ToolManager(self.config)
+        return self._tool_manager
 
     def map_event(self, event: dict[str, Any] | Any) -> BaseEvent | None:
         """Map a native LangGraph event to a Vibe TUI event.
@@ -87,42 +125,48 @@ class TUIEventMapper:
         else:
             event_data = event
 
-        event_type = event_data.get("event", "")
-
-        match event_type:
-            case "on_chat_model_stream":
-                return self._map_chat_model_stream(event_data)
-
-            case "on_tool_start":
-                return self._map_tool_start(event_data)
+        handler = self._handlers.get(event_data.get("event", ""))
+        # Other event types are not relevant for TUI display
+        if handler is None:
+            return None
+        return handler(event_data)
 
-            case "on_tool_end":
-                return self._map_tool_end(event_data)
+    def map_chat_model_stream(
+        self, event_data: Mapping[str, Any]
+    ) -> AssistantEvent | None:
+        """Map on_chat_model_stream event to AssistantEvent.
 
-            case "on_tool_error":
-                return self._map_tool_error(event_data)
+        Args:
+            event_data: The event data dict containing 'chunk' under 'data'
 
-            case "on_interrupt":
-                return self._map_interrupt_event(event_data)
+        Returns:
+            AssistantEvent with the chunk content, or None if invalid
+        """
+        content = self.chunk_text(event_data)
+        if content is None:
+            return None
+        return AssistantEvent(content=content)
 
-            # Other event types are not relevant for TUI display
-            case _:
-                return None
+    @staticmethod
+    def chunk_text(event_data: Mapping[str, Any]) -> str | None:
+        """Extract the text of an on_chat_model_stream event.
 
-    def _map_chat_model_stream(
-        self, event_data: dict[str, Any]
-    ) -> AssistantEvent | None:
-        """Map on_chat_model_stream event to AssistantEvent.
+        Public so callers that already know the event type can skip both the
+        generic dispatch in `map_event` and building an AssistantEvent per
+        token, the highest-frequency work in a stream.
 
         Args:
             event_data: The event data dict containing 'chunk' under 'data'
 
         Returns:
-            AssistantEvent with the chunk content, or None if invalid
+            The chunk's non-empty text content, or None if there is none
         """
-        chunk = event_data.get("data", {}).get("chunk")
-        if chunk and hasattr(chunk, "content") and chunk.content:
-            return AssistantEvent(content=chunk.content)
+        data = event_data.get("data")
+        if data is None:
+            return None
+        content = getattr(data.get("chunk"), "content", None)
+        if content and isinstance(content, str):
+            return content
         return None
 
     def _map_tool_start(self, event_data: dict[str, Any]) -> ToolCallEvent | None:
@@ -138,7 +182,8 @@ class TUIEventMapper:
         if not tool_name:
             return None
 
-        tool_args = event_data.get("data", {}).get("input", {})
+        data = event_data.get("data") or _EMPTY
+        tool_args = data.get("input") or _EMPTY
         tool_call_id = event_data.get("run_id", "")
 
         # Log the tool call
@@ -149,10 +194,10 @@ class TUIEventMapper:
         except Exception:
             logger.info(f"[TOOL CALL] Tool: {tool_name}")
 
-        tool_class = self._get_tool_class(tool_name)
+        tool_info = self._get_tool_info(tool_name)
 
-        if tool_class:
-            args_model = tool_class._get_tool_args_results()[0]
+        if tool_info:
+            tool_class, args_model, _ = tool_info
             try:
                 args = args_model.model_validate(tool_args)
             except ValidationError as e:
@@ -161,10 +206,10 @@ class TUIEventMapper:
                     tool_name,
                     e,
                 )
-                args = GenericArgs(args=tool_args)
+                args = _generic_args(tool_args)
         else:
             # Fallback for unknown tools
-            args = GenericArgs(args=tool_args)
+            args = _generic_args(tool_args)
             tool_class = None
 
         return ToolCallEvent(
@@ -187,7 +232,8 @@ class TUIEventMapper:
         if not tool_name:
             return None
 
-        tool_result = event_data.get("data", {}).get("output", "")
+        data = event_data.get("data") or _EMPTY
+        tool_result = data.get("output", "")
         tool_call_id = event_data.get("run_id", "")
 
         # Log the tool result
@@ -203,11 +249,10 @@ class TUIEventMapper:
         except Exception:
             logger.info(f"[TOOL RESULT] Tool: {tool_name}")
 
-        tool_class = self._get_tool_class(tool_name)
+        tool_info = self._get_tool_info(tool_name)
 
-        if tool_class:
-            # Get result model from the second element of _get_tool_args_results
-            _, result_model = tool_class._get_tool_args_results()
+        if tool_info:
+            tool_class, _, result_model = tool_info
             try:
                 result = result_model.model_validate({"output": tool_result})
             except ValidationError as e:
@@ -216,10 +261,11 @@ class TUIEventMapper:
                     tool_name,
                     e,
                 )
-                result = GenericResult(output=str(tool_result))
+                result = GenericResult.model_construct(output=str(tool_result))
         else:
             # Fallback for unknown tools
-            result = GenericResult(output=str(tool_result))
+            result = GenericResult.model_construct(output=str(tool_result))
+            tool_class = None
 
         return ToolResultEvent(
             tool_name=tool_name,
@@ -241,7 +287,7 @@ class TUIEventMapper:
         if not tool_name:
             return None
 
-        error_obj = event_data.get("data", {}).get("error")
+        error_obj = (event_data.get("data") or _EMPTY).get("error")
         error_message = str(error_obj) if error_obj else "Unknown tool error"
         tool_call_id = event_data.get("run_id", "")
 
@@ -253,21 +299,32 @@ class TUIEventMapper:
             tool_call_id=tool_call_id,
         )
 
-    def _get_tool_class(self, tool_name: str) -> type[BaseTool] | None:
-        """Get tool class for a tool name.
+    def _get_tool_info(self, tool_name: str) -> _ToolInfo | None:
+        """Get the tool class and its args/result models for a tool name.
+
+        Lookups are cached per tool name, including misses.
 
         Args:
             tool_name: The name of the tool to look up
 
         Returns:
-            The tool class, or None if not found.
+            The (tool class, args model, result model) tuple, or None if not found.
         """
+        cached = self._tool_info_cache.get(tool_name, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        tool_info: _ToolInfo | None
         try:
-            tool_instance = self.tool_manager.get(tool_name)
-            return tool_instance.__class__
+            tool_class = self.tool_manager.get(tool_name).__class__
         except NoSuchToolError as e:
             logger.debug("Could not get tool class: %s", e)
-            return None
+            tool_info = None
+        else:
+            tool_info = (tool_class, *tool_class._get_tool_args_results())
+
+        self._tool_info_cache[tool_name] = tool_info
+        return tool_info
 
     def _map_interrupt_event(self, event_data: dict[str, Any]) -> InterruptEvent | None:
         """Map on_interrupt event to InterruptEvent.
@@ -288,7 +345,8 @@ class TUIEventMapper:
 
         # Log the interrupt details
         try:
-            action_requests = interrupt_data.get("data", {}).get("action_requests", [])
+            data = interrupt_data.get("data") or _EMPTY
+            action_requests = data.get("action_requests", [])
             if isinstance(action_requests, list):
                 logger.info(
                     f"[HITL INTERRUPT] Tools requiring approval: {len(action_requests)}"
@@ -430,16 +430,16 @@ class EditTool(BaseTool):
         Returns:
             True if this is a valid retry, False otherwise.
         """
-        if file_path not in self._warned_operations:
+        warning = self._warned_operations.get(file_path)
+        if warning is None:
             return False
 
-        warning = self._warned_operations[file_path]
         current_time = int(time.time() * 1000)
         time_diff = current_time - warning.timestamp
 
         if time_diff > MISTAKEN_EDIT_TIMEOUT_MS:
             # Expired warning, remove it
-            del self._warned_operations[file_path]
+            self._warned_operations.pop(file_path, None)
             return False
 
         # Check if hashes match (same operation)
@@ -24,6 +24,7 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 import re
 from typing import Any, ClassVar, TypedDict
@@ -535,6 +536,21 @@ class GrepTool(BaseTool):
         Returns:
             List of search results with file path and matches.
         """
+        # Reading and scanning files is blocking work; run it in a thread so
+        # the agent's other tool calls in the same turn are not held up
+        return await asyncio.to_thread(
+            self._search_files, files, query, case_sensitive, regex, max_results
+        )
+
+    def _search_files(
+        self,
+        files: list[Path],
+        query: str,
+        case_sensitive: bool,
+        regex: bool,
+        max_results: int,
+    ) -> list[SearchResult]:
+        """Synchronously search files for matches, see `_execute_search`."""
         results: list[SearchResult] = []
         total_matches = 0
 
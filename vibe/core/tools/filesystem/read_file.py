@@ -22,6 +22,7 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 import mimetypes
@@ -442,9 +443,9 @@ class ReadFileTool(BaseTool):
         Raises:
             FileSystemError: If view_range is invalid.
         """
-        # Read file content
+        # Read file content off the event loop so parallel tool calls overlap
         try:
-            content = path.read_text(encoding="utf-8")
+            content = await asyncio.to_thread(path.read_text, encoding="utf-8")
         except OSError as e:
             raise FileSystemError(
                 message=f"Permission denied: '{path}'",
@@ -251,18 +251,18 @@ class ToolManager:
         Raises:
             NoSuchToolError: If the requested tool is not available.
         """
-        if tool_name in self._instances:
-            return self._instances[tool_name]
+        if (instance := self._instances.get(tool_name)) is not None:
+            return instance
 
-        if tool_name not in self._available:
+        tool_class = self._available.get(tool_name)
+        if tool_class is None:
             raise NoSuchToolError(
                 f"Unknown tool: {tool_name}. Available: {list(self._available.keys())}"
             )
 
-        tool_class = self._available[tool_name]
         tool_config = self.get_tool_config(tool_name)
-        self._instances[tool_name] = tool_class.from_config(tool_config)
-        return self._instances[tool_name]
+        instance = self._instances[tool_name] = tool_class.from_config(tool_config)
+        return instance
 
     def reset_all(self) -> None:
         self._instances.clear()